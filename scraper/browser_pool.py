@@ -0,0 +1,66 @@
+# scraper/browser_pool.py
+#
+# Single-thread only: sync Playwright objects belong to the thread that
+# started them, so the pooled browser must be created, used and closed on
+# one thread (the scraper's main thread).
+
+import atexit
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Playwright is optional — callers check PLAYWRIGHT_AVAILABLE first
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+_playwright = None
+_browser = None
+_owner_thread = None
+
+
+def get_browser():
+    """Return the process-wide headless Chromium, launching it on first use.
+
+    Raises RuntimeError if the sync API can't start (e.g. inside a running
+    asyncio loop) or if called from a thread other than the one that
+    launched the browser — callers decide how to fall back.
+    """
+    global _playwright, _browser, _owner_thread
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        try:
+            _browser = _playwright.chromium.launch(headless=True)
+        except Exception:
+            _playwright.stop()
+            _playwright = None
+            raise
+        _owner_thread = threading.get_ident()
+        logger.info("Shared browser launched")
+    elif threading.get_ident() != _owner_thread:
+        raise RuntimeError("browser_pool is single-thread; the shared browser "
+                           "belongs to another thread")
+    return _browser
+
+
+def new_context(**kwargs):
+    """Open an isolated context (cookies, storage) on the shared browser."""
+    return get_browser().new_context(**kwargs)
+
+
+def close_browser():
+    """Shut down the shared browser. Safe to call more than once."""
+    global _playwright, _browser, _owner_thread
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+    _owner_thread = None
+
+
+atexit.register(close_browser)
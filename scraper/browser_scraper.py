@@ -8,14 +8,13 @@ import time
 import random
 from typing import Dict, List, Optional
 
+import browser_pool
+from browser_pool import PLAYWRIGHT_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 # Playwright is optional — graceful degradation if not installed
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     logger.info("Playwright not installed — browser scraping disabled. "
                 "Install with: pip install playwright && playwright install chromium")
 
@@ -26,7 +25,8 @@ class BrowserScraper:
     Uses Playwright (Chromium) to render pages that return 0 players
     with static HTML parsing.
 
-    Reuses a single browser instance across schools for speed.
+    Reuses the shared browser from browser_pool (one fresh context per
+    school) so the Chromium process stays warm across calls.
     """
 
     def __init__(self, parser, config: dict = None):
@@ -39,8 +39,7 @@ class BrowserScraper:
         self.config = config or {}
         self.timeout = self.config.get('page_load_timeout', 15000)
         self.max_schools = self.config.get('max_schools_per_run', 50)
-        self._playwright = None
-        self._browser = None
+        self._browser_ready = False
         self._use_subprocess = False
 
     @property
@@ -55,11 +54,11 @@ class BrowserScraper:
             return False
         if self._use_subprocess:
             return True
-        if self._browser is None:
+        if not self._browser_ready:
             try:
-                self._playwright = sync_playwright().start()
-                self._browser = self._playwright.chromium.launch(headless=True)
-                logger.info("Browser launched for JS rendering")
+                browser_pool.get_browser()
+                self._browser_ready = True
+                logger.info("Browser ready for JS rendering")
             except RuntimeError as e:
                 if 'asyncio' in str(e).lower() or 'event loop' in str(e).lower():
                     logger.warning(f"Playwright sync API failed (asyncio conflict): {e}")
@@ -70,13 +69,9 @@ class BrowserScraper:
         return True
 
     def close(self):
-        """Clean up browser resources."""
-        if self._browser:
-            self._browser.close()
-            self._browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
+        """Shut down the shared browser (also done automatically at exit)."""
+        browser_pool.close_browser()
+        self._browser_ready = False
 
     def scrape_school(self, school: dict) -> dict:
         """
@@ -116,7 +111,8 @@ class BrowserScraper:
 
         logger.info(f"  Browser scraping: {school_name}")
 
-        page = self._browser.new_page()
+        context = browser_pool.new_context()
+        page = context.new_page()
         page.set_default_timeout(self.timeout)
 
         try:
@@ -174,7 +170,7 @@ class BrowserScraper:
             result['success'] = len(result['players']) > 0
 
         finally:
-            page.close()
+            context.close()
 
         return result
 
@@ -311,25 +307,24 @@ print(json.dumps(results))
         logger.info(f"Browser scrape pass: {len(batch)} schools")
         results = []
 
-        try:
-            for i, school in enumerate(batch):
-                try:
-                    result = self.scrape_school(school)
-                    results.append(result)
-
-                    if result['success']:
-                        logger.info(f"  Browser recovered {school['school_name']}: "
-                                   f"{len(result['players'])} players")
-
-                    # Brief delay between schools
-                    if i < len(batch) - 1:
-                        time.sleep(random.uniform(2, 4))
-
-                except Exception as e:
-                    logger.error(f"Browser error for {school['school_name']}: {e}")
-                    continue
-        finally:
-            self.close()
+        # The shared browser stays open for later passes; browser_pool
+        # closes it at interpreter exit.
+        for i, school in enumerate(batch):
+            try:
+                result = self.scrape_school(school)
+                results.append(result)
+
+                if result['success']:
+                    logger.info(f"  Browser recovered {school['school_name']}: "
+                               f"{len(result['players'])} players")
+
+                # Brief delay between schools
+                if i < len(batch) - 1:
+                    time.sleep(random.uniform(2, 4))
+
+            except Exception as e:
+                logger.error(f"Browser error for {school['school_name']}: {e}")
+                continue
 
         recovered = sum(1 for r in results if r['success'])
         logger.info(f"Browser scrape complete: {recovered}/{len(batch)} schools recovered")
@@ -266,7 +266,7 @@ def load_ncsa_schools() -> List[dict]:
         logger.warning(f"NCSA file not found: {NCSA_FILE}")
         logger.warning("Run scrape_ncsa.py first")
         return []
-    with open(NCSA_FILE) as f:
+    with open(NCSA_FILE, encoding='utf-8') as f:
         return json.load(f)
 
 
@@ -276,7 +276,7 @@ def load_wikipedia_schools() -> List[dict]:
         logger.warning(f"Wikipedia file not found: {WIKIPEDIA_FILE}")
         logger.warning("Run scrape_wikipedia.py first (optional)")
         return []
-    with open(WIKIPEDIA_FILE) as f:
+    with open(WIKIPEDIA_FILE, encoding='utf-8') as f:
         return json.load(f)
 
 
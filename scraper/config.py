@@ -7,6 +7,7 @@ INITIAL_SCRAPE_CONFIG = {
     'between_schools': (1, 2),             # different domain, no courtesy needed
     'max_schools_per_day': 1000,           # DB checkpoint handles dedup; 6hr timeout is the real limit
     'max_requests_per_hour': 9999,         # no limit (cross-domain, logging only)
+    'per_host_limit': 4,                   # max concurrent sockets per host
 }
 
 # Phase 2: Daily Updates (half of all schools per day, alternating groups)
@@ -16,12 +17,14 @@ DAILY_UPDATE_CONFIG = {
     'between_schools': (1, 3),             # different domains, minimal courtesy needed
     'max_schools_per_day': 700,            # ~600 schools per half, with headroom
     'max_requests_per_hour': 9999,         # no limit (cross-domain, logging only)
+    'per_host_limit': 4,                   # max concurrent sockets per host
 }
 
 # Error handling
 ERROR_CONFIG = {
     'retry_delay_base': 5,
     'retry_delay_max': 15,
+    'jitter': 0.5,                         # backoff multiplied by uniform(1 - jitter, 1 + jitter)
     'max_retries': 1,                      # No retries — if first attempt fails, move on
     'consecutive_failures_limit': 20,
     'circuit_breaker_cooldown': 300,       # 5 minutes
@@ -4,6 +4,7 @@ import argparse
 import logging
 import time
 import random
+import signal
 import sys
 from datetime import datetime, date
 from pathlib import Path
@@ -431,6 +432,7 @@ class CollegeBaseballScraper:
                 success=self.schools_scraped_today > 0
             )
             self.db.close()
+            self.request_handler.close()
 
         logger.info(f"Scrape session complete. "
                     f"Schools: {self.schools_scraped_today}, "
@@ -630,6 +632,7 @@ class CollegeBaseballScraper:
                 success=self.schools_scraped_today > 0
             )
             self.db.close()
+            self.request_handler.close()
 
         logger.info(f"Recovery complete. Recovered: {self.schools_scraped_today} schools, "
                     f"{self.total_players_scraped} players")
@@ -694,16 +697,26 @@ def main():
 
     scraper = CollegeBaseballScraper()
 
-    if args.command == 'run':
-        scraper.run(force=args.force, dry_run=args.dry_run)
-    elif args.command == 'diagnostic':
-        scraper.run_diagnostic()
-    elif args.command == 'status':
-        print(scraper.scheduler.get_status_report())
-    elif args.command == 'cleanup':
-        scraper.run_cleanup()
-    elif args.command == 'recover':
-        scraper.run_recover(dry_run=args.dry_run)
+    # Ctrl-C: release any pause/backoff wait in the request handler, then
+    # raise KeyboardInterrupt as usual so the run loops stop and clean up
+    def handle_sigint(signum, frame):
+        scraper.request_handler.shutdown()
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGINT, handle_sigint)
+
+    # The scheduler's history database is closed on every exit path, so
+    # scrape_history.db is fully written before the workflow uploads it
+    with scraper.scheduler:
+        if args.command == 'run':
+            scraper.run(force=args.force, dry_run=args.dry_run)
+        elif args.command == 'diagnostic':
+            scraper.run_diagnostic()
+        elif args.command == 'status':
+            print(scraper.scheduler.get_status_report())
+        elif args.command == 'cleanup':
+            scraper.run_cleanup()
+        elif args.command == 'recover':
+            scraper.run_recover(dry_run=args.dry_run)
 
 
 if __name__ == '__main__':
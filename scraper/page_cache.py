@@ -0,0 +1,55 @@
+# scraper/page_cache.py
+
+import logging
+import shelve
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_CACHE = str(Path(__file__).parent / 'page_cache')
+DEFAULT_TTL = 24 * 3600
+
+
+class PageCache:
+    """
+    On-disk cache of page bodies keyed by URL, with a fixed TTL.
+    Lets development re-runs of the list scrapers (Wikipedia, NCSA) skip
+    refetching pages that rarely change.
+    """
+
+    def __init__(self, path: str = DEFAULT_PAGE_CACHE, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        try:
+            self._db = shelve.open(path)
+        except Exception as e:
+            logger.warning(f"Page cache unavailable ({e}); fetching everything")
+            self._db = None
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for url, or None if missing or expired."""
+        if self._db is None:
+            return None
+        entry = self._db.get(url)
+        if entry is None:
+            return None
+        stored_at, body = entry
+        if time.time() - stored_at > self.ttl:
+            return None
+        return body
+
+    def put(self, url: str, body: bytes):
+        if self._db is not None:
+            self._db[url] = (time.time(), body)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,10 +1,13 @@
 # scraper/request_handler.py
 
-import time
 import random
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
 import requests
 
 from config import STOP_SIGNALS
@@ -30,41 +33,102 @@ class ProtectedRequestHandler:
         self.config = config
         self.error_config = error_config
         self.session = requests.Session()
+        # Keep-alive pool sized for the threads sharing this handler
+        # ('pool_size' in config); retries are handled explicitly in get(),
+        # so the adapter must not retry.
+        pool_size = self.config.get('pool_size', 32)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True, max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Includes 'br' only when brotli is installed, so bodies always decode
+        self.session.headers.update({'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING})
         self.request_count = 0
         self.hourly_request_count = 0
-        self.hour_start = datetime.now()
+        # Pacing timestamps are time.monotonic() values (immune to clock jumps)
+        self.hour_start = time.monotonic()
         self.last_request_time = None
         self.consecutive_failures = 0
         self.current_user_agent_index = 0
-        self.is_paused = False
-        self.pause_until = None
-        self.last_error_type = None  # 'connection', 'timeout', 'http', 'ssl'
-
-    def _rotate_user_agent(self) -> str:
-        """Rotate user agent periodically"""
-        if self.request_count % random.randint(15, 25) == 0:
-            self.current_user_agent_index = random.randint(0, len(self.USER_AGENTS) - 1)
-        return self.USER_AGENTS[self.current_user_agent_index]
-
-    def _get_headers(self, referer: str = None) -> dict:
-        """Generate realistic browser headers"""
-        headers = {
-            'User-Agent': self._rotate_user_agent(),
+        self._next_rotate_at = random.randint(15, 25)
+        # Static browser headers, built once per user agent. The no-referer
+        # dicts are returned as-is (requests never mutates them); callers
+        # that need extra headers must copy first.
+        base_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none' if not referer else 'same-origin',
+            'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0',
         }
-        if referer:
-            headers['Referer'] = referer
+        self._headers_cache = tuple(
+            {**base_headers, 'User-Agent': ua} for ua in self.USER_AGENTS
+        )
+        self._headers_same_origin = tuple(
+            {**h, 'Sec-Fetch-Site': 'same-origin'} for h in self._headers_cache
+        )
+        self.is_paused = False
+        self.pause_until = None
+        self.last_error_type = None  # 'connection', 'timeout', 'http', 'ssl'
+        # Caps open sockets per host when the handler is shared across threads
+        self._per_host_limit = self.config.get('per_host_limit', 4)
+        self._host_sems: Dict[str, threading.Semaphore] = {}
+        self._host_sems_lock = threading.Lock()
+        # Set by shutdown() to break out of pause/pacing/backoff waits
+        self._shutdown = threading.Event()
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore for the URL's host, created under a lock on first use."""
+        host = urlparse(url).netloc
+        with self._host_sems_lock:
+            sem = self._host_sems.get(host)
+            if sem is None:
+                sem = self._host_sems[host] = threading.Semaphore(self._per_host_limit)
+        return sem
+
+    def shutdown(self):
+        """Interrupt any in-progress wait; subsequent requests return None"""
+        self._shutdown.set()
+
+    def close(self):
+        """Close the session and release pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _rotate_user_agent(self) -> str:
+        """Rotate user agent periodically"""
+        if self.request_count >= self._next_rotate_at:
+            self.current_user_agent_index = random.randrange(len(self.USER_AGENTS))
+            self._next_rotate_at = self.request_count + random.randint(15, 25)
+        return self.USER_AGENTS[self.current_user_agent_index]
+
+    def _get_headers(self, referer: str = None) -> dict:
+        """Generate realistic browser headers (shared dict when no referer)"""
+        self._rotate_user_agent()
+        if not referer:
+            return self._headers_cache[self.current_user_agent_index]
+        headers = self._headers_same_origin[self.current_user_agent_index].copy()
+        headers['Referer'] = referer
         return headers
 
+    def _compute_backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter so concurrent scrapers don't retry in lockstep"""
+        base = self.error_config.get('retry_delay_base', 10)
+        cap = self.error_config.get('retry_delay_max', 30)
+        jitter = self.error_config.get('jitter', 0.5)
+        return min(cap, base * (2 ** attempt)) * random.uniform(1 - jitter, 1 + jitter)
+
     def _check_hourly_limit(self):
         """Track hourly request count (logging only, no blocking).
 
@@ -72,21 +136,48 @@ class ProtectedRequestHandler:
         is counterproductive — it causes 40+ minute stalls while
         scraping hundreds of unrelated sites.
         """
-        now = datetime.now()
-        if (now - self.hour_start).total_seconds() > 3600:
+        now = time.monotonic()
+        if now - self.hour_start > 3600:
             logger.info(f"Hourly stats: {self.hourly_request_count} requests in last hour")
             self.hourly_request_count = 0
             self.hour_start = now
 
+    def _pacing_delay(self, delay_type: str = 'between_requests') -> float:
+        """Seconds left to wait before the next request (0 if none)"""
+        if self.last_request_time is None:
+            return 0
+        delay_range = self.config.get(delay_type, (5, 10))
+        delay = random.uniform(*delay_range)
+        elapsed = time.monotonic() - self.last_request_time
+        return max(0, delay - elapsed)
+
     def _wait_between_requests(self, delay_type: str = 'between_requests'):
         """Wait appropriate amount of time between requests"""
-        if self.last_request_time:
-            delay_range = self.config.get(delay_type, (5, 10))
-            delay = random.uniform(*delay_range)
-            elapsed = (datetime.now() - self.last_request_time).total_seconds()
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                time.sleep(sleep_time)
+        sleep_time = self._pacing_delay(delay_type)
+        if sleep_time > 0:
+            self._shutdown.wait(sleep_time)
+
+    @staticmethod
+    def _parse_retry_after(value, default: int = 60) -> int:
+        """Parse a Retry-After header (delay-seconds or HTTP-date) into seconds.
+
+        Result is clamped to [0, 3600]. Returns ``default`` if the value
+        is missing or unparseable.
+        """
+        if value is None:
+            return default
+        value = str(value).strip()
+        if value.isdigit():
+            seconds = int(value)
+        else:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                return default
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return int(max(0, min(seconds, 3600)))
 
     def _handle_error_response(self, response, url: str) -> bool:
         """Handle error responses. Returns True if should retry."""
@@ -94,15 +185,23 @@ class ProtectedRequestHandler:
 
         if status == 429:
             # Actually rate-limited — respect Retry-After, max 60s
-            retry_after = response.headers.get('Retry-After', 60)
-            wait_time = min(int(retry_after) if str(retry_after).isdigit() else 60, 60)
+            wait_time = min(self._parse_retry_after(response.headers.get('Retry-After')), 60)
             logger.warning(f"Rate limited (429) from {url}. Waiting {wait_time}s...")
             self.consecutive_failures += 1
-            self.pause_until = datetime.now() + timedelta(seconds=wait_time)
+            self.pause_until = time.monotonic() + wait_time
+            self.is_paused = True
+            return False
+
+        if status == 503 and 'Retry-After' in response.headers:
+            # Server told us exactly when to come back — honor it (max 60s),
+            # but don't count it toward the circuit breaker.
+            wait_time = min(self._parse_retry_after(response.headers['Retry-After']), 60)
+            logger.warning(f"HTTP 503 for {url} with Retry-After. Waiting {wait_time}s...")
+            self.pause_until = time.monotonic() + wait_time
             self.is_paused = True
             return False
 
-        # 403, 503, and all other errors — just skip, don't pause.
+        # 403, a 503 without Retry-After, and all other errors — just skip, don't pause.
         # A 403 from one school doesn't mean we're IP blocked everywhere.
         if status >= 400:
             logger.warning(f"HTTP {status} for {url} - skipping")
@@ -121,16 +220,24 @@ class ProtectedRequestHandler:
             logger.warning(f"Circuit breaker: {self.consecutive_failures} consecutive failures (resetting)")
             self.consecutive_failures = 0
 
+    def _pause_remaining(self) -> float:
+        """Seconds left in the current pause (0 if not paused)"""
+        if self.is_paused and self.pause_until:
+            return max(0, self.pause_until - time.monotonic())
+        return 0
+
+    def _end_pause(self):
+        self.is_paused = False
+        self.pause_until = None
+
     def _check_pause(self):
         """Check if we're paused and wait if needed"""
-        if self.is_paused and self.pause_until:
-            now = datetime.now()
-            if now < self.pause_until:
-                wait_seconds = (self.pause_until - now).total_seconds()
-                logger.info(f"Scraper paused. Resuming in {wait_seconds / 60:.1f} minutes...")
-                time.sleep(wait_seconds)
-            self.is_paused = False
-            self.pause_until = None
+        wait_seconds = self._pause_remaining()
+        if wait_seconds > 0:
+            logger.info(f"Scraper paused. Resuming in {wait_seconds / 60:.1f} minutes...")
+            if self._shutdown.wait(wait_seconds):
+                return
+        self._end_pause()
 
     def get(self, url: str, delay_type: str = 'between_requests',
             referer: str = None) -> Optional[requests.Response]:
@@ -149,19 +256,26 @@ class ProtectedRequestHandler:
         # Wait between requests
         self._wait_between_requests(delay_type)
 
+        return self._fetch(url, referer)
+
+    def _fetch(self, url: str, referer: str = None) -> Optional[requests.Response]:
+        """Issue the request with retries (no pause/pacing checks)"""
+        if self._shutdown.is_set():
+            return None
+
         # Make request with retries
         max_retries = self.error_config.get('max_retries', 3)
         for attempt in range(max_retries):
             try:
-                # Clear cookies between different domains
-                response = self.session.get(
-                    url,
-                    headers=self._get_headers(referer),
-                    timeout=15,
-                    allow_redirects=True
-                )
-
-                self.last_request_time = datetime.now()
+                with self._host_slot(url):
+                    response = self.session.get(
+                        url,
+                        headers=self._get_headers(referer),
+                        timeout=15,
+                        allow_redirects=True
+                    )
+
+                self.last_request_time = time.monotonic()
                 self.request_count += 1
                 self.hourly_request_count += 1
 
@@ -183,14 +297,15 @@ class ProtectedRequestHandler:
                 # Retry once with verify=False (recovers expired/misconfigured certs)
                 try:
                     logger.warning(f"SSL error for {url} - retrying without verification")
-                    response = self.session.get(
-                        url,
-                        headers=self._get_headers(referer),
-                        timeout=15,
-                        allow_redirects=True,
-                        verify=False
-                    )
-                    self.last_request_time = datetime.now()
+                    with self._host_slot(url):
+                        response = self.session.get(
+                            url,
+                            headers=self._get_headers(referer),
+                            timeout=15,
+                            allow_redirects=True,
+                            verify=False
+                        )
+                    self.last_request_time = time.monotonic()
                     self.request_count += 1
                     self.hourly_request_count += 1
 
@@ -221,8 +336,8 @@ class ProtectedRequestHandler:
                 self.last_error_type = 'timeout'
                 logger.warning(f"Timeout for {url} (attempt {attempt + 1}/{max_retries})")
                 if attempt < max_retries - 1:
-                    backoff = self.error_config.get('retry_delay_base', 10) * (attempt + 1)
-                    time.sleep(min(backoff, self.error_config.get('retry_delay_max', 30)))
+                    if self._shutdown.wait(self._compute_backoff(attempt)):
+                        return None
 
             except requests.RequestException as e:
                 # Generic request failure — don't increment circuit breaker.
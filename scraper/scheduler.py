@@ -5,8 +5,14 @@ from typing import List, Dict
 import csv
 import json
 import logging
+import sqlite3
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,11 +22,18 @@ class SmartScheduler:
     Every school gets scraped every 2 days.
     """
 
+    # Scrape priority: D1 first, then D2, then D3, then anything else
+    DIVISION_ORDER = {'D1': 0, 'D2': 1, 'D3': 2}
+
     def __init__(self, schools_db_path: str = None):
         if schools_db_path is None:
             schools_db_path = str(Path(__file__).parent / 'schools_database.csv')
         self.schools_db_path = schools_db_path
         self.schools = self._load_schools(schools_db_path)
+        self._index_schools()
+        # SQLite so each mark_scraped is a single-row write; the legacy
+        # JSON file is only read once to seed a fresh database.
+        self.history_db_path = Path(__file__).parent / 'scrape_history.db'
         self.history_file = Path(__file__).parent / 'scrape_history.json'
         self.scrape_history = self._load_history()
 
@@ -40,33 +53,102 @@ class SmartScheduler:
         logger.info(f"Loaded {len(schools)} schools from database")
         return schools
 
+    def _index_schools(self):
+        """Precompute lookups over the school list (it doesn't change after load)"""
+        self._all_names = frozenset(s['school_name'] for s in self.schools)
+
+        # A/B day groups: alternate schools in alphabetical order, each
+        # group then ordered D1 > D2 > D3 (stable, so alphabetical within)
+        sorted_schools = sorted(self.schools, key=lambda x: x['school_name'])
+        self._day_groups = tuple(
+            sorted(sorted_schools[g::2], key=self._division_rank) for g in (0, 1)
+        )
+
+    def _division_rank(self, school: Dict) -> int:
+        return self.DIVISION_ORDER.get(school.get('division', ''), 3)
+
     def _load_history(self) -> Dict:
-        """Load scrape history"""
-        if self.history_file.exists():
-            return json.loads(self.history_file.read_text())
-        return {'last_scraped': {}, 'initial_scrape_complete': False}
+        """Load scrape history, migrating scrape_history.json into a new database"""
+        is_new = not self.history_db_path.exists()
+        self.history_db = sqlite3.connect(self.history_db_path)
+        self.history_db.execute(
+            'CREATE TABLE IF NOT EXISTS last_scraped (school_name TEXT PRIMARY KEY, scraped_on TEXT)'
+        )
+        self.history_db.execute(
+            'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)'
+        )
+        if is_new and self.history_file.exists():
+            self._migrate_json_history()
+
+        last_scraped = dict(self.history_db.execute(
+            'SELECT school_name, scraped_on FROM last_scraped'
+        ))
+        row = self.history_db.execute(
+            "SELECT value FROM meta WHERE key = 'initial_scrape_complete'"
+        ).fetchone()
+        return {
+            'last_scraped': last_scraped,
+            'initial_scrape_complete': bool(row and row[0] == '1'),
+        }
+
+    def _migrate_json_history(self):
+        """One-shot import of the legacy JSON history file"""
+        if orjson is not None:
+            legacy = orjson.loads(self.history_file.read_bytes())
+        else:
+            legacy = json.loads(self.history_file.read_text())
+        with self.history_db:
+            self.history_db.executemany(
+                'INSERT OR REPLACE INTO last_scraped VALUES (?, ?)',
+                legacy.get('last_scraped', {}).items()
+            )
+            self.history_db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('initial_scrape_complete', ?)",
+                ('1' if legacy.get('initial_scrape_complete') else '0',)
+            )
+        logger.info(f"Migrated {len(legacy.get('last_scraped', {}))} entries "
+                    f"from {self.history_file.name} to {self.history_db_path.name}")
+
+    def close(self):
+        """Close the history database so the file is complete on disk
+        (the workflow uploads it as an artifact). Safe to call twice."""
+        if self.history_db is not None:
+            self.history_db.close()
+            self.history_db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def _save_history(self):
-        """Save scrape history"""
-        self.history_file.write_text(json.dumps(self.scrape_history, indent=2))
+        """Save scrape history flags (per-school dates are written by mark_scraped)"""
+        with self.history_db:
+            self.history_db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('initial_scrape_complete', ?)",
+                ('1' if self.scrape_history.get('initial_scrape_complete') else '0',)
+            )
 
     def mark_scraped(self, school_name: str):
         """Mark a school as scraped today"""
-        self.scrape_history['last_scraped'][school_name] = date.today().isoformat()
-        self._save_history()
+        today = date.today().isoformat()
+        self.scrape_history['last_scraped'][school_name] = today
+        with self.history_db:
+            self.history_db.execute(
+                'INSERT OR REPLACE INTO last_scraped VALUES (?, ?)', (school_name, today)
+            )
 
     def is_initial_scrape_complete(self) -> bool:
         """Check if we've scraped all schools at least once"""
         if self.scrape_history.get('initial_scrape_complete'):
             return True
 
-        scraped_schools = set(self.scrape_history['last_scraped'].keys())
-        all_schools = set(s['school_name'] for s in self.schools)
-
-        if not all_schools:
+        if not self._all_names:
             return False
 
-        if scraped_schools >= all_schools:
+        if self._all_names <= self.scrape_history['last_scraped'].keys():
             self.scrape_history['initial_scrape_complete'] = True
             self._save_history()
             return True
@@ -88,15 +170,9 @@ class SmartScheduler:
         if not self.is_initial_scrape_complete():
             return self._get_initial_scrape_batch()
 
-        # Sort alphabetically for a stable, deterministic split
-        sorted_schools = sorted(self.schools, key=lambda x: x['school_name'])
+        # Groups are split alphabetically and prioritized D1 > D2 > D3 at load
         group = self._get_todays_group()
-
-        # Select every other school based on today's group
-        todays_schools = [s for i, s in enumerate(sorted_schools) if i % 2 == group]
-
-        # Prioritize D1 > D2 > D3 within today's group
-        todays_schools.sort(key=lambda x: {'D1': 0, 'D2': 1, 'D3': 2}.get(x.get('division', ''), 3))
+        todays_schools = list(self._day_groups[group])
 
         logger.info(f"Today is group {'A' if group == 0 else 'B'}: "
                     f"{len(todays_schools)} schools to scrape")
@@ -109,7 +185,7 @@ class SmartScheduler:
         unscraped = [s for s in self.schools if s['school_name'] not in scraped]
 
         # Prioritize by division: D1 first, then D2, then D3
-        unscraped.sort(key=lambda x: {'D1': 0, 'D2': 1, 'D3': 2}.get(x.get('division', ''), 3))
+        unscraped.sort(key=self._division_rank)
 
         from config import INITIAL_SCRAPE_CONFIG
         max_schools = INITIAL_SCRAPE_CONFIG['max_schools_per_day']
@@ -139,19 +215,19 @@ class SmartScheduler:
                 "========================================\n"
             )
 
-        d1_total = len([s for s in self.schools if s.get('division') == 'D1'])
-        d2_total = len([s for s in self.schools if s.get('division') == 'D2'])
-        d3_total = len([s for s in self.schools if s.get('division') == 'D3'])
+        # One pass: [total, scraped] per division
+        counts = {div: [0, 0] for div in self.DIVISION_ORDER}
+        scraped = self.scrape_history['last_scraped']
+        for s in self.schools:
+            c = counts.get(s.get('division'))
+            if c is None:
+                continue
+            c[0] += 1
+            c[1] += s['school_name'] in scraped
 
-        d1_scraped = len([s for s in self.schools
-                         if s.get('division') == 'D1'
-                         and s['school_name'] in self.scrape_history['last_scraped']])
-        d2_scraped = len([s for s in self.schools
-                         if s.get('division') == 'D2'
-                         and s['school_name'] in self.scrape_history['last_scraped']])
-        d3_scraped = len([s for s in self.schools
-                         if s.get('division') == 'D3'
-                         and s['school_name'] in self.scrape_history['last_scraped']])
+        d1_total, d1_scraped = counts['D1']
+        d2_total, d2_scraped = counts['D2']
+        d3_total, d3_scraped = counts['D3']
 
         phase = 'Daily Updates' if self.is_initial_scrape_complete() else 'Initial Scrape'
         pct = 100 * scraped_schools / total_schools
@@ -161,8 +237,7 @@ class SmartScheduler:
         d3_pct = (100 * d3_scraped / d3_total) if d3_total else 0
 
         group = self._get_todays_group()
-        sorted_schools = sorted(self.schools, key=lambda x: x['school_name'])
-        today_count = len([s for i, s in enumerate(sorted_schools) if i % 2 == group])
+        today_count = len(self._day_groups[group])
 
         report = f"""
 ========================================
@@ -5,20 +5,36 @@ scrape_ncsa.py
 Scrapes NCSA Sports division pages to build an authoritative list of all
 NCAA baseball programs across D1, D2, and D3.
 
-Uses Playwright to render JS content (the college lists are client-side rendered).
+Each division list is first fetched as static HTML over one HTTP/2 client;
+Playwright only renders divisions whose server-rendered markup comes back
+short (the college lists may be client-side rendered). Rendered divisions
+are scraped concurrently, one BrowserContext each, in a single headless
+Chromium.
 
 Output: ncsa_schools.json
 
 Usage:
     pip install playwright && playwright install chromium
     python scrape_ncsa.py
+    python scrape_ncsa.py --athletics-urls   # also resolve each school's athletics site
+    python scrape_ncsa.py --no-cache         # ignore raw HTML cached in the last 24h
 """
 
+import argparse
+import asyncio
 import json
 import logging
-import time
+import math
+import re
 import sys
+from collections import Counter
 from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+import lxml.html
+
+from page_cache import PageCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,11 +46,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson is optional — faster serialization, falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx is optional — without it every division goes through Playwright
 try:
-    from playwright.sync_api import sync_playwright
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    logger.error("Playwright is required. Install with: pip install playwright && playwright install chromium")
-    sys.exit(1)
+    HTTPX_AVAILABLE = False
 
 OUTPUT_FILE = Path(__file__).parent / 'ncsa_schools.json'
 
@@ -50,53 +73,176 @@ EXPECTED_COUNTS = {
     'D3': 390,
 }
 
+# A division list is complete at this percentage of EXPECTED_COUNTS;
+# static results below it are re-scraped with the browser
+COMPLETE_PCT = 95
+
+# Scrolling stops once this multiple of EXPECTED_COUNTS rows has loaded
+SCROLL_TARGET_FACTOR = 1.1
+
+# Max divisions scraped at once — keeps us well under NCSA's rate cap
+MAX_CONCURRENT_DIVISIONS = 3
+
+USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+              'AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/120.0.0.0 Safari/537.36')
+
+# Rows on the rendered page that show the list has started filling in
+RENDERED_MIN_ROWS = 50
+
+# One school row in the NCSA list (same selector as _extract_schools)
+_ROW_SELECTOR = '.wp-block-ncsa-college-list .row, [itemtype*="CollegeOrUniversity"]'
+
+# Any of these appearing means the college list has started rendering
+_CONTENT_SELECTORS = (
+    '.college-list',
+    '.wp-block-ncsa-college-list',
+    '[class*="CollegeList"]',
+    '[class*="college"]',
+    '[data-testid*="college"]',
+    'table',
+    'a[href*="/baseball/"]',
+)
 
-def scrape_division(page, division: str, url: str, max_retries: int = 3) -> list:
+# Max in-flight school-page fetches. Every page is on the NCSA host,
+# so this is effectively a per-host politeness limit.
+ATHLETICS_CONCURRENCY = 8
+
+_TYPE_RE = re.compile(r'^(Public|Private)$', re.I)
+_DIVISION_RE = re.compile(r'^NCAA D[123]$', re.I)
+_CONFERENCE_RE = re.compile(r'Conference|League|Athletic|NAIA')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a single CSS class token"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def _extract_schools_from_html(html: str, page_url: str, division: str) -> list:
+    """Python port of _extract_schools for server-rendered HTML."""
+    try:
+        doc = lxml.html.fromstring(html)
+    except (ValueError, lxml.etree.ParserError):
+        return []
+    doc.make_links_absolute(page_url, resolve_base_href=True)
+
+    results = []
+    seen = set()
+    rows = doc.xpath(
+        f'//*[{_has_class("wp-block-ncsa-college-list")}]//*[{_has_class("row")}]'
+        ' | //*[contains(@itemtype, "CollegeOrUniversity")]'
+    )
+    for row in rows:
+        # School name from itemprop="name" or first <a>
+        name_els = row.xpath('.//*[@itemprop="name"]') or row.xpath('.//a')
+        name = name_els[0].text_content().strip() if name_els else ''
+        key = name.lower()
+        if not name or len(name) < 3 or key in seen:
+            continue
+
+        link_els = row.xpath('.//a[@href]')
+        link = link_els[0].get('href', '') if link_els else ''
+
+        state = ''
+        address_els = row.xpath('.//*[@itemprop="address"]')
+        if address_els:
+            region_els = address_els[0].xpath('.//*[@itemprop="addressRegion"]')
+            state = region_els[0].text_content().strip() if region_els else ''
+            if not state:
+                # Fallback: last span in address
+                spans = address_els[0].xpath('.//span')
+                if len(spans) >= 2:
+                    state = spans[-1].text_content().strip()
+
+        conference = ''
+        containers = row.xpath(f'.//*[{_has_class("container")}]')
+        container = containers[0] if containers else row
+        for div in container.xpath('./div'):
+            text = div.text_content().strip()
+            # Skip name, address, type (Public/Private), and division divs
+            if div.xpath('.//*[@itemprop]'):
+                continue
+            if _TYPE_RE.match(text) or _DIVISION_RE.match(text):
+                continue
+            if _CONFERENCE_RE.search(text):
+                conference = text
+                break
+
+        seen.add(key)
+        results.append({'name': name, 'state': state, 'conference': conference,
+                        'link': link, 'division': division})
+
+    return results
+
+
+async def fetch_static(client, division: str, url: str,
+                       cache: Optional[PageCache] = None) -> list:
+    """Fetch a division list without a browser. Returns [] on any failure."""
+    html = cache.get(url) if cache else None
+    if html is not None:
+        schools = _extract_schools_from_html(html, url, division)
+        logger.info(f"[{division}] Static HTML: {len(schools)} schools (cached)")
+        return schools
+    try:
+        resp = await client.get(url)
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"[{division}] Static fetch failed: {e}")
+        return []
+    if cache:
+        cache.put(url, resp.content)
+    schools = _extract_schools_from_html(resp.text, str(resp.url), division)
+    logger.info(f"[{division}] Static HTML: {len(schools)} schools ({resp.http_version})")
+    return schools
+
+
+async def scrape_division(page, division: str, url: str, max_retries: int = 3) -> list:
     """Scrape a single NCSA division page for school entries."""
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"[{division}] Attempt {attempt}: navigating to {url}")
             # Use domcontentloaded — networkidle never fires on NCSA (analytics/ads)
             try:
-                page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
             except Exception as nav_err:
                 logger.warning(f"[{division}] Navigation issue: {nav_err}, trying to continue anyway")
 
-            # Wait for JS to render the college list
-            # NCSA uses React — content renders after initial DOM load
-            selectors = [
-                '.college-list',
-                '.wp-block-ncsa-college-list',
-                '[class*="CollegeList"]',
-                '[class*="college"]',
-                '[data-testid*="college"]',
-                'table',
-                'a[href*="/baseball/"]',
-            ]
-
+            # Wait for JS to render the college list (NCSA uses React —
+            # content renders after initial DOM load). Poll all selectors
+            # inside the page in one round-trip; resolves with the first match
             list_found = False
-            for selector in selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=15000)
-                    list_found = True
-                    logger.info(f"[{division}] Found content with selector: {selector}")
-                    break
-                except Exception:
-                    continue
+            try:
+                handle = await page.wait_for_function(
+                    "(sels) => sels.find(s => document.querySelector(s))",
+                    arg=_CONTENT_SELECTORS, timeout=15000,
+                )
+                list_found = True
+                logger.info(f"[{division}] Found content with selector: {await handle.json_value()}")
+            except Exception:
+                pass
 
             if not list_found:
                 # Last resort: just wait for page to settle
                 logger.warning(f"[{division}] No known selector matched, waiting 10s for content")
-                time.sleep(10)
+                await asyncio.sleep(10)
 
             # Scroll to bottom to trigger lazy-loading
-            _scroll_to_bottom(page)
+            expected = EXPECTED_COUNTS.get(division)
+            await _scroll_to_bottom(
+                page, target_rows=math.ceil(expected * SCROLL_TARGET_FACTOR) if expected else 0)
 
-            # Give extra time for any final renders
-            time.sleep(3)
+            # Wait for the list itself to finish rendering rather than a fixed
+            # settle delay; fall through and extract whatever is there on timeout
+            try:
+                await page.wait_for_function(
+                    "([sel, n]) => document.querySelectorAll(sel).length > n",
+                    arg=(_ROW_SELECTOR, RENDERED_MIN_ROWS), timeout=15000,
+                )
+            except Exception:
+                logger.warning(f"[{division}] Fewer than {RENDERED_MIN_ROWS} rows rendered after 15s")
 
             # Extract schools from the rendered page
-            schools = _extract_schools(page, division)
+            schools = await _extract_schools(page, division)
 
             if schools:
                 logger.info(f"[{division}] Extracted {len(schools)} schools")
@@ -110,35 +256,50 @@ def scrape_division(page, division: str, url: str, max_retries: int = 3) -> list
         if attempt < max_retries:
             backoff = 2 ** attempt
             logger.info(f"[{division}] Retrying in {backoff}s...")
-            time.sleep(backoff)
+            await asyncio.sleep(backoff)
 
     logger.error(f"[{division}] All {max_retries} attempts failed")
     return []
 
 
-def _scroll_to_bottom(page):
-    """Scroll page incrementally to trigger lazy-loaded content."""
-    prev_height = 0
-    for _ in range(20):
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(0.5)
-        curr_height = page.evaluate("document.body.scrollHeight")
-        if curr_height == prev_height:
-            break
-        prev_height = curr_height
+# Whole scroll loop runs inside the page: scroll, poll until the document
+# grows (or stepMs passes), repeat — no CDP round-trips per step. Stops early
+# once targetRows rows matching sel are on the page (0 = no target)
+_SCROLL_JS = """async ([maxMs, stepMs, sel, targetRows]) => {
+    const deadline = performance.now() + maxMs;
+    for (let i = 0; i < 20 && performance.now() < deadline; i++) {
+        if (targetRows && document.querySelectorAll(sel).length >= targetRows) break;
+        const prevH = document.body.scrollHeight;
+        window.scrollTo(0, prevH);
+        const stepEnd = Math.min(performance.now() + stepMs, deadline);
+        while (document.body.scrollHeight <= prevH && performance.now() < stepEnd) {
+            await new Promise(r => setTimeout(r, 100));
+        }
+        if (document.body.scrollHeight <= prevH) break;
+    }
+}"""
 
 
-def _extract_schools(page, division: str) -> list:
-    """Extract school entries from the rendered NCSA page.
+async def _scroll_to_bottom(page, max_seconds: float = 5, target_rows: int = 0):
+    """Scroll page incrementally to trigger lazy-loaded content.
 
-    NCSA structure: .wp-block-ncsa-college-list contains .row divs with
-    Schema.org ListItem markup. Each row has a .container with:
-      - [itemprop="name"] > a = school name + link
-      - [itemprop="address"] > spans = city, state
-      - div with conference text
-      - div with division text (NCAA D1/D2/D3)
+    Each step waits only until the page grows (or 1.5s passes), rather
+    than a fixed sleep; the whole routine is capped at ``max_seconds``
+    and ends early once ``target_rows`` school rows have loaded.
     """
-    schools = page.evaluate("""() => {
+    await page.evaluate(_SCROLL_JS, [max_seconds * 1000, 1500, _ROW_SELECTOR, target_rows])
+
+
+# Installed in every context via add_init_script, so each extraction only
+# sends a one-line call instead of re-shipping and re-parsing this source.
+# Wrapped in an IIFE so its helpers don't leak into the page's globals.
+_EXTRACT_JS = """
+(() => {
+    const RE_TYPE = /^(Public|Private)$/i;
+    const RE_DIV = /^NCAA D[123]$/i;
+    const RE_CONF = /Conference|League|Athletic|NAIA/;
+
+    window.__extractSchools = () => {
         const results = [];
         const seen = new Set();
 
@@ -153,8 +314,9 @@ def _extract_schools(page, division: str) -> list:
             const nameEl = row.querySelector('[itemprop="name"]') ||
                            row.querySelector('a');
             const name = nameEl?.textContent?.trim() || '';
+            const key = name.toLowerCase();
 
-            if (!name || name.length < 3 || seen.has(name.toLowerCase())) continue;
+            if (!name || name.length < 3 || seen.has(key)) continue;
 
             // Link
             const linkEl = row.querySelector('a[href]');
@@ -184,21 +346,34 @@ def _extract_schools(page, division: str) -> list:
                 const text = div.textContent?.trim() || '';
                 // Skip name, address, type (Public/Private), and division divs
                 if (div.querySelector('[itemprop]')) continue;
-                if (/^(Public|Private)$/i.test(text)) continue;
-                if (/^NCAA D[123]$/i.test(text)) continue;
-                if (text.includes('Conference') || text.includes('League') ||
-                    text.includes('Athletic') || text.includes('NAIA')) {
+                if (RE_TYPE.test(text) || RE_DIV.test(text)) continue;
+                if (RE_CONF.test(text)) {
                     conference = text;
                     break;
                 }
             }
 
-            seen.add(name.toLowerCase());
+            seen.add(key);
             results.push({ name, state, conference, link });
         }
 
         return results;
-    }""")
+    };
+})();
+"""
+
+
+async def _extract_schools(page, division: str) -> list:
+    """Extract school entries from the rendered NCSA page.
+
+    NCSA structure: .wp-block-ncsa-college-list contains .row divs with
+    Schema.org ListItem markup. Each row has a .container with:
+      - [itemprop="name"] > a = school name + link
+      - [itemprop="address"] > spans = city, state
+      - div with conference text
+      - div with division text (NCAA D1/D2/D3)
+    """
+    schools = await page.evaluate("() => window.__extractSchools()")
 
     # Post-process: add division tag
     for school in schools:
@@ -207,11 +382,75 @@ def _extract_schools(page, division: str) -> list:
     return schools
 
 
-def scrape_ncsa_school_page(page, school_url: str) -> dict:
+def _parse_athletics_url(html: str, page_url: str) -> Optional[str]:
+    """Find the athletics site link in server-rendered school page HTML.
+
+    Same text heuristic as scrape_ncsa_school_page's in-browser JS.
+    """
+    try:
+        doc = lxml.html.fromstring(html)
+    except (ValueError, lxml.etree.ParserError):
+        return None
+    doc.make_links_absolute(page_url, resolve_base_href=True)
+    for a in doc.iter('a'):
+        href = a.get('href') or ''
+        if 'http' not in href:
+            continue
+        text = a.text_content().lower()
+        if 'athletics' in text or 'official site' in text or 'website' in text:
+            return href
+    return None
+
+
+async def _fetch_athletics_url(client, semaphore, school_url: str,
+                               cache: Optional[PageCache] = None) -> Optional[str]:
+    """Fetch one NCSA school page as raw HTML and pull out its athletics link."""
+    html = cache.get(school_url) if cache else None
+    if html is not None:
+        return _parse_athletics_url(html, school_url)
+    async with semaphore:
+        resp = await client.get(school_url)
+    if resp.status_code != 200:
+        return None
+    if cache:
+        cache.put(school_url, resp.content)
+    return _parse_athletics_url(resp.text, str(resp.url))
+
+
+async def _resolve_athletics_urls_static(schools: list,
+                                         cache: Optional[PageCache] = None) -> list:
+    """Fill in ``athletics_url`` from server-rendered HTML, concurrently.
+
+    Returns the schools still missing a URL (need a rendered page).
+    """
+    pending = [s for s in schools if s.get('link')]
+    if not HTTPX_AVAILABLE or not pending:
+        return pending
+
+    semaphore = asyncio.Semaphore(ATHLETICS_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers={'User-Agent': USER_AGENT},
+                                 timeout=15, follow_redirects=True) as client:
+        found = await asyncio.gather(
+            *(_fetch_athletics_url(client, semaphore, s['link'], cache) for s in pending),
+            return_exceptions=True,
+        )
+
+    missing = []
+    for school, url in zip(pending, found):
+        if isinstance(url, str):
+            school['athletics_url'] = url
+        else:
+            missing.append(school)
+    logger.info(f"Athletics URLs from raw HTML: {len(pending) - len(missing)}/{len(pending)}")
+    return missing
+
+
+async def scrape_ncsa_school_page(page, school_url: str) -> dict:
     """Try to scrape an individual NCSA school page for the athletics URL."""
     try:
-        page.goto(school_url, wait_until='networkidle', timeout=30000)
-        info = page.evaluate("""() => {
+        # domcontentloaded — networkidle never fires on NCSA (analytics/ads)
+        await page.goto(school_url, wait_until='domcontentloaded', timeout=30000)
+        info = await page.evaluate("""() => {
             const result = {};
             // Look for athletics website link
             const links = document.querySelectorAll('a[href]');
@@ -231,33 +470,166 @@ def scrape_ncsa_school_page(page, school_url: str) -> dict:
         return {}
 
 
-def main():
-    logger.info("=" * 60)
-    logger.info("NCSA Baseball Program Scraper")
-    logger.info("=" * 60)
+# Nothing the extractors read depends on these, so don't download them
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_BLOCKED_HOSTS = (
+    'doubleclick.net', 'google-analytics.com', 'googletagmanager.com',
+    'googlesyndication.com', 'segment.io', 'facebook.net', 'hotjar.com',
+)
 
-    all_schools = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                       'AppleWebKit/537.36 (KHTML, like Gecko) '
-                       'Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = context.new_page()
+async def _block_heavy_resources(route):
+    """Route handler: abort images/fonts/media/CSS and analytics beacons."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    host = urlparse(request.url).hostname or ''
+    if host.endswith(_BLOCKED_HOSTS):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+async def _new_context(browser):
+    """New browser context: scraper UA, heavy resources blocked, extractor installed."""
+    context = await browser.new_context(user_agent=USER_AGENT)
+    await context.route("**/*", _block_heavy_resources)
+    await context.add_init_script(_EXTRACT_JS)
+    return context
+
+
+async def _resolve_athletics_urls_rendered(browser, schools: list):
+    """Browser fallback for schools whose athletics link needs JS to render."""
+    context = await _new_context(browser)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DIVISIONS)
+
+    async def resolve(school):
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                info = await scrape_ncsa_school_page(page, school['link'])
+            finally:
+                await page.close()
+        if info.get('athletics_url'):
+            school['athletics_url'] = info['athletics_url']
+
+    try:
+        await asyncio.gather(*(resolve(s) for s in schools))
+    finally:
+        await context.close()
+    found = sum(1 for s in schools if s.get('athletics_url'))
+    logger.info(f"Athletics URLs from rendered pages: {found}/{len(schools)}")
+
+
+async def _scrape_division_in_context(browser, semaphore, division: str, url: str) -> list:
+    """Scrape one division in its own BrowserContext.
+
+    Separate contexts keep cookies and lazy-load state from colliding
+    while the divisions render concurrently in one Chromium process.
+    """
+    async with semaphore:
+        context = await _new_context(browser)
+        try:
+            page = await context.new_page()
+            schools = await scrape_division(page, division, url)
+        finally:
+            await context.close()
+    logger.info(f"[{division}] Total: {len(schools)} schools")
+    return schools
+
+
+async def _fetch_all_static(cache: Optional[PageCache] = None) -> dict:
+    """Fetch every division list over one HTTP/2 client. Returns division -> schools."""
+    if not HTTPX_AVAILABLE:
+        return {}
+    async with httpx.AsyncClient(http2=True, headers={'User-Agent': USER_AGENT},
+                                 timeout=30, follow_redirects=True) as client:
+        results = await asyncio.gather(*(
+            fetch_static(client, division, url, cache) for division, url in DIVISION_URLS.items()
+        ))
+    return dict(zip(DIVISION_URLS, results))
+
+
+def _division_complete(division: str, count: int) -> bool:
+    """True when count reaches COMPLETE_PCT of the division's expected size."""
+    expected = EXPECTED_COUNTS.get(division, 0)
+    return expected > 0 and count * 100 >= expected * COMPLETE_PCT
 
-        for division, url in DIVISION_URLS.items():
-            schools = scrape_division(page, division, url)
-            all_schools.extend(schools)
-            logger.info(f"[{division}] Total: {len(schools)} schools")
-            time.sleep(2)
 
-        browser.close()
+def _require_playwright():
+    """Import async_playwright on first need; exit with install help if missing.
+    Imported here so runs the static path fully covers don't need Chromium."""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        logger.error("Playwright is required. Install with: pip install playwright && playwright install chromium")
+        sys.exit(1)
+    return async_playwright
+
+
+async def _scrape_all_divisions(fetch_athletics_urls: bool = False,
+                                cache: Optional[PageCache] = None) -> list:
+    """Scrape every division concurrently, rendering only where static HTML falls short."""
+    static = await _fetch_all_static(cache)
+    # The list lazy-loads, so a partial first batch can be server-rendered;
+    # only a near-complete static list skips the browser
+    results = {div: schools for div, schools in static.items()
+               if _division_complete(div, len(schools))}
+
+    need_browser = [div for div in DIVISION_URLS if div not in results]
+    if need_browser:
+        async_playwright = _require_playwright()
+        logger.info(f"Rendering with Playwright: {', '.join(need_browser)}")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DIVISIONS)
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                rendered = await asyncio.gather(*(
+                    asyncio.create_task(_scrape_division_in_context(browser, semaphore, div, DIVISION_URLS[div]))
+                    for div in need_browser
+                ))
+            finally:
+                await browser.close()
+        # Keep the static rows if rendering came back with fewer
+        for div, schools in zip(need_browser, rendered):
+            partial = static.get(div, [])
+            results[div] = schools if len(schools) >= len(partial) else partial
+
+    # Flatten in DIVISION_URLS order so output is stable across runs
+    all_schools = [school for div in DIVISION_URLS for school in results.get(div, [])]
+
+    if fetch_athletics_urls:
+        missing = await _resolve_athletics_urls_static(all_schools, cache)
+        if missing:
+            async_playwright = _require_playwright()
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                try:
+                    await _resolve_athletics_urls_rendered(browser, missing)
+                finally:
+                    await browser.close()
+
+    return all_schools
+
+
+def main(fetch_athletics_urls: bool = False, use_cache: bool = True):
+    logger.info("=" * 60)
+    logger.info("NCSA Baseball Program Scraper")
+    logger.info("=" * 60)
+
+    if use_cache:
+        with PageCache() as cache:
+            all_schools = asyncio.run(_scrape_all_divisions(fetch_athletics_urls, cache))
+    else:
+        all_schools = asyncio.run(_scrape_all_divisions(fetch_athletics_urls))
 
     # Save results
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(all_schools, f, indent=2)
+    if orjson is not None:
+        OUTPUT_FILE.write_bytes(orjson.dumps(all_schools, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(all_schools, f, indent=2)
     logger.info(f"Saved {len(all_schools)} schools to {OUTPUT_FILE}")
 
     # Validation summary
@@ -265,18 +637,16 @@ def main():
     print("NCSA Scrape Results")
     print("=" * 60)
 
-    division_counts = {}
-    for s in all_schools:
-        div = s.get('division', '?')
-        division_counts[div] = division_counts.get(div, 0) + 1
+    division_counts = Counter(s.get('division', '?') for s in all_schools)
 
     all_ok = True
     for div in ['D1', 'D2', 'D3']:
         count = division_counts.get(div, 0)
         expected = EXPECTED_COUNTS.get(div, 0)
         pct = (count / expected * 100) if expected > 0 else 0
-        status = 'OK' if pct >= 95 else 'LOW'
-        if pct < 95:
+        complete = _division_complete(div, count)
+        status = 'OK' if complete else 'LOW'
+        if not complete:
             all_ok = False
         print(f"  {div}: {count:>4} schools (expected ~{expected}, {pct:.0f}%) [{status}]")
 
@@ -286,11 +656,17 @@ def main():
     print("=" * 60)
 
     if not all_ok:
-        logger.warning("Some divisions are below 95% of expected count!")
+        logger.warning(f"Some divisions are below {COMPLETE_PCT}% of expected count!")
         logger.warning("Check if NCSA page structure has changed.")
 
     return all_schools
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Scrape NCSA baseball division pages')
+    parser.add_argument('--athletics-urls', action='store_true',
+                        help="Also visit each school's NCSA page to find its athletics site")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Refetch pages even if cached within the last 24 hours')
+    args = parser.parse_args()
+    main(fetch_athletics_urls=args.athletics_urls, use_cache=not args.no_cache)
@@ -9,17 +9,23 @@ Output: wikipedia_schools.json
 
 Usage:
     python scrape_wikipedia.py
+    python scrape_wikipedia.py --no-cache   # ignore pages cached in the last 24h
 """
 
+import argparse
+import asyncio
 import json
 import logging
 import re
-import time
+from collections import Counter
 from pathlib import Path
+from typing import Optional
 
 import requests
 from bs4 import BeautifulSoup
 
+from page_cache import PageCache
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
@@ -30,6 +36,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson is optional — faster serialization, falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx is optional — both pages share one HTTP/2 connection when present
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 OUTPUT_FILE = Path(__file__).parent / 'wikipedia_schools.json'
 
 WIKIPEDIA_URLS = {
@@ -37,21 +56,39 @@ WIKIPEDIA_URLS = {
     'D2': 'https://en.wikipedia.org/wiki/List_of_NCAA_Division_II_baseball_programs',
 }
 
+# Footnote references like [1], [a]
+_FOOTNOTE_RE = re.compile(r'\[.*?\]')
+
 HEADERS = {
     'User-Agent': 'CollegeBaseballTracker/1.0 (educational project; '
                   'https://github.com/testajc/college-baseball-tracker)'
 }
 
 
-def scrape_wikipedia_table(url: str, division: str) -> list:
-    """Scrape a Wikipedia list-of-programs page for school entries."""
-    logger.info(f"[{division}] Fetching {url}")
-
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, 'html.parser')
+async def scrape_wikipedia_table(client, url: str, division: str,
+                                 cache: Optional[PageCache] = None) -> list:
+    """Scrape a Wikipedia list-of-programs page for school entries.
+
+    ``client`` is an httpx.AsyncClient, or None to fetch with requests
+    on a worker thread.
+    """
+    content = cache.get(url) if cache else None
+    if content is not None:
+        logger.info(f"[{division}] Using cached copy of {url}")
+    else:
+        logger.info(f"[{division}] Fetching {url}")
+        if client is not None:
+            resp = await client.get(url)
+        else:
+            resp = await asyncio.to_thread(requests.get, url, headers=HEADERS, timeout=30)
+        resp.raise_for_status()
+        content = resp.content
+        if cache:
+            cache.put(url, content)
+
+    soup = BeautifulSoup(content, 'lxml')
     schools = []
+    seen = set()  # lowercase names, so repeated rows are dropped as we parse
 
     # Wikipedia program tables are typically <table class="wikitable sortable">
     tables = soup.find_all('table', class_='wikitable')
@@ -79,16 +116,16 @@ def scrape_wikipedia_table(url: str, division: str) -> list:
             if len(cells) <= name_col:
                 continue
 
-            name = cells[name_col].get_text(strip=True)
-            # Clean up name — remove footnote references like [1], [a]
-            name = re.sub(r'\[.*?\]', '', name).strip()
+            name = _clean(cells[name_col])
 
             if not name or len(name) < 2:
                 continue
 
-            # Skip header-like rows
-            if name.lower() in ('school', 'team', 'institution', 'total'):
+            # Skip header-like rows and repeats
+            key = name.lower()
+            if key in ('school', 'team', 'institution', 'total') or key in seen:
                 continue
+            seen.add(key)
 
             school = {
                 'name': name,
@@ -99,16 +136,13 @@ def scrape_wikipedia_table(url: str, division: str) -> list:
             }
 
             if conf_col is not None and conf_col < len(cells):
-                conf = cells[conf_col].get_text(strip=True)
-                school['conference'] = re.sub(r'\[.*?\]', '', conf).strip()
+                school['conference'] = _clean(cells[conf_col])
 
             if state_col is not None and state_col < len(cells):
-                state = cells[state_col].get_text(strip=True)
-                school['state'] = re.sub(r'\[.*?\]', '', state).strip()
+                school['state'] = _clean(cells[state_col])
 
             if nickname_col is not None and nickname_col < len(cells):
-                nick = cells[nickname_col].get_text(strip=True)
-                school['nickname'] = re.sub(r'\[.*?\]', '', nick).strip()
+                school['nickname'] = _clean(cells[nickname_col])
 
             # Try to extract athletics URL from link in name cell
             link = cells[name_col].find('a', href=True)
@@ -126,6 +160,11 @@ def scrape_wikipedia_table(url: str, division: str) -> list:
     return schools
 
 
+def _clean(cell) -> str:
+    """Cell text with footnote references stripped."""
+    return _FOOTNOTE_RE.sub('', cell.get_text(strip=True)).strip()
+
+
 def _find_column(headers: list, keywords: list) -> int:
     """Find the index of a column matching any of the keywords."""
     for i, h in enumerate(headers):
@@ -135,22 +174,46 @@ def _find_column(headers: list, keywords: list) -> int:
     return None
 
 
-def main():
+async def _scrape_all(cache: Optional[PageCache] = None) -> list:
+    """Fetch every division page concurrently. Returns a list per division."""
+    # Only two pages on one host, multiplexed over a single connection —
+    # no inter-request sleep needed to stay polite.
+    if not HTTPX_AVAILABLE:
+        return await asyncio.gather(*(
+            scrape_wikipedia_table(None, url, division, cache)
+            for division, url in WIKIPEDIA_URLS.items()
+        ))
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, timeout=30,
+                                 follow_redirects=True) as client:
+        return await asyncio.gather(*(
+            scrape_wikipedia_table(client, url, division, cache)
+            for division, url in WIKIPEDIA_URLS.items()
+        ))
+
+
+def main(use_cache: bool = True):
     logger.info("=" * 60)
     logger.info("Wikipedia NCAA Baseball Program Scraper")
     logger.info("=" * 60)
 
     all_schools = []
 
-    for division, url in WIKIPEDIA_URLS.items():
-        schools = scrape_wikipedia_table(url, division)
+    if use_cache:
+        with PageCache() as cache:
+            results = asyncio.run(_scrape_all(cache))
+    else:
+        results = asyncio.run(_scrape_all())
+
+    for division, schools in zip(WIKIPEDIA_URLS, results):
         all_schools.extend(schools)
         logger.info(f"[{division}] Total: {len(schools)} schools")
-        time.sleep(2)  # Be respectful
 
     # Save results
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(all_schools, f, indent=2)
+    if orjson is not None:
+        OUTPUT_FILE.write_bytes(orjson.dumps(all_schools, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(all_schools, f, indent=2)
     logger.info(f"Saved {len(all_schools)} schools to {OUTPUT_FILE}")
 
     # Summary
@@ -158,9 +221,9 @@ def main():
     print("Wikipedia Scrape Results")
     print("=" * 60)
 
+    division_counts = Counter(s['division'] for s in all_schools)
     for div in ['D1', 'D2']:
-        count = sum(1 for s in all_schools if s['division'] == div)
-        print(f"  {div}: {count} schools")
+        print(f"  {div}: {division_counts[div]} schools")
 
     print(f"  Total: {len(all_schools)} schools (D1 + D2 only)")
     print("  Note: D3 not available on Wikipedia — use NCSA for D3")
@@ -170,4 +233,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Scrape Wikipedia D1/D2 baseball program lists')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Refetch pages even if cached within the last 24 hours')
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache)
@@ -2,13 +2,23 @@
 
 import re
 import logging
+from collections import OrderedDict
+from io import BytesIO
 from urllib.parse import urljoin, urlparse
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# hrefs that never lead to another page — skipped before urljoin
+_NON_NAVIGABLE_PREFIXES = ('#', 'mailto:', 'tel:', 'javascript:', 'data:')
+
+# Only anchors / sitemap <loc> entries are ever read — skip building the rest of the tree
+_ANCHORS_ONLY = SoupStrainer('a', href=True)
+_LOCS_ONLY = SoupStrainer('loc')
+
 
 class UrlDiscoverer:
     """
@@ -16,6 +26,12 @@ class UrlDiscoverer:
     Used as a fallback when standard SIDEARM URL patterns return 404/405.
     """
 
+    # Pages whose links are kept in memory for the life of the discoverer
+    LINK_CACHE_SIZE = 256
+
+    def __init__(self):
+        self._link_cache: 'OrderedDict[str, Optional[List[Tuple[str, str]]]]' = OrderedDict()
+
     @staticmethod
     def _is_related_domain(link_domain: str, base_domain: str) -> bool:
         """Check if a link domain is the same or a subdomain/sibling of the base domain.
@@ -29,30 +45,43 @@ class UrlDiscoverer:
         link_root = '.'.join(link_parts[-2:]) if len(link_parts) >= 2 else link_domain
         return link_root == base_root
 
-    # Patterns that indicate a baseball roster page
-    ROSTER_PATTERNS = [
-        re.compile(r'baseball.*roster', re.I),
-        re.compile(r'roster.*baseball', re.I),
-        re.compile(r'/roster\.aspx\?.*baseball', re.I),
-        re.compile(r'/sport/m-basebl/roster', re.I),
-        re.compile(r'/sports/bsb/.*roster', re.I),
-        re.compile(r'/sports/m-baseb[al]*/.*roster', re.I),
-        re.compile(r'/teams/baseball/roster', re.I),
-        re.compile(r'/athletics/baseball/roster', re.I),
-    ]
-
-    # Patterns that indicate a baseball stats page
-    STATS_PATTERNS = [
-        re.compile(r'baseball.*stat', re.I),
-        re.compile(r'stat.*baseball', re.I),
-        re.compile(r'/teamstats\.aspx\?.*baseball', re.I),
-        re.compile(r'/sport/m-basebl/stat', re.I),
-        re.compile(r'/sports/bsb/.*stat', re.I),
-        re.compile(r'/sports/m-baseb[al]*/.*stat', re.I),
-        re.compile(r'/teams/baseball/stat', re.I),
-        re.compile(r'/athletics/baseball/stat', re.I),
-        re.compile(r'teamcume\.htm', re.I),
-    ]
+    @staticmethod
+    def _resolve_link(page_url: str, href: str):
+        """Return (full_url, domain) for an href, or (None, None) if it isn't a page link.
+        Absolute links skip urljoin, which dominates per-link cost on big pages."""
+        head = href[:11].lower()
+        if head.startswith(('http://', 'https://')):
+            full_url = href
+        elif head.startswith(_NON_NAVIGABLE_PREFIXES):
+            return None, None
+        else:
+            full_url = urljoin(page_url, href)
+        return full_url, urlparse(full_url).netloc
+
+    # Patterns that indicate a baseball roster page, fused into one regex
+    ROSTER_RE = re.compile('|'.join([
+        r'baseball.*roster',
+        r'roster.*baseball',
+        r'/roster\.aspx\?.*baseball',
+        r'/sport/m-basebl/roster',
+        r'/sports/bsb/.*roster',
+        r'/sports/m-baseb[al]*/.*roster',
+        r'/teams/baseball/roster',
+        r'/athletics/baseball/roster',
+    ]), re.I)
+
+    # Patterns that indicate a baseball stats page, fused into one regex
+    STATS_RE = re.compile('|'.join([
+        r'baseball.*stat',
+        r'stat.*baseball',
+        r'/teamstats\.aspx\?.*baseball',
+        r'/sport/m-basebl/stat',
+        r'/sports/bsb/.*stat',
+        r'/sports/m-baseb[al]*/.*stat',
+        r'/teams/baseball/stat',
+        r'/athletics/baseball/stat',
+        r'teamcume\.htm',
+    ]), re.I)
 
     # Patterns for a baseball landing/sport page (intermediate step)
     BASEBALL_LANDING_PATTERNS = [
@@ -64,6 +93,12 @@ class UrlDiscoverer:
         re.compile(r'\bbaseball\b', re.I),
     ]
 
+    # Links on a landing page that are not themselves the landing page
+    NOT_LANDING_RE = re.compile(r'roster|stats|schedule|recruit', re.I)
+
+    ROSTER_WORD_RE = re.compile(r'\broster\b', re.I)
+    STAT_WORD_RE = re.compile(r'\bstat', re.I)
+
     def discover_baseball_urls(self, base_url: str, request_handler) -> Optional[Dict[str, str]]:
         """
         Attempt to discover baseball roster and stats URLs by crawling.
@@ -100,39 +135,48 @@ class UrlDiscoverer:
         logger.info(f"  URL discovery: no baseball URLs found for {base_url}")
         return None
 
+    def _get_links(self, url: str, request_handler) -> Optional[List[Tuple[str, str]]]:
+        """Fetch a page and return its (href, text) anchors, or None if the fetch failed.
+        Memoized (LRU) so the homepage is fetched and parsed once per school."""
+        if url in self._link_cache:
+            self._link_cache.move_to_end(url)
+            return self._link_cache[url]
+
+        resp = request_handler.get(url)
+        links = None
+        if resp:
+            soup = BeautifulSoup(resp.content, 'lxml', parse_only=_ANCHORS_ONLY)
+            links = [(a['href'], a.get_text()) for a in soup.find_all('a')]
+
+        self._link_cache[url] = links
+        if len(self._link_cache) > self.LINK_CACHE_SIZE:
+            self._link_cache.popitem(last=False)
+        return links
+
     def _scan_page_for_baseball(self, page_url: str, base_domain: str,
                                 request_handler) -> Optional[Dict[str, str]]:
         """Scan a page for baseball roster AND stats links."""
-        resp = request_handler.get(page_url)
-        if not resp:
+        links = self._get_links(page_url, request_handler)
+        if not links:
             return None
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        links = soup.find_all('a', href=True)
-
         roster_url = None
         stats_url = None
 
-        for link in links:
-            href = link['href']
-            full_url = urljoin(page_url, href)
-            link_domain = urlparse(full_url).netloc
+        for href, text in links:
+            full_url, link_domain = self._resolve_link(page_url, href)
+            if full_url is None:
+                continue
 
             # Roster: same-domain only
-            if link_domain == base_domain:
-                for pattern in self.ROSTER_PATTERNS:
-                    if pattern.search(href) or pattern.search(link.get_text()):
-                        if not roster_url:
-                            roster_url = full_url
-                        break
+            if not roster_url and link_domain == base_domain:
+                if self.ROSTER_RE.search(href) or self.ROSTER_RE.search(text):
+                    roster_url = full_url
 
             # Stats: allow related domains (e.g., data.clemsontigers.com)
-            if self._is_related_domain(link_domain, base_domain):
-                for pattern in self.STATS_PATTERNS:
-                    if pattern.search(href) or pattern.search(link.get_text()):
-                        if not stats_url:
-                            stats_url = full_url
-                        break
+            if not stats_url and self._is_related_domain(link_domain, base_domain):
+                if self.STATS_RE.search(href) or self.STATS_RE.search(text):
+                    stats_url = full_url
 
             if roster_url and stats_url:
                 break
@@ -144,21 +188,16 @@ class UrlDiscoverer:
     def _find_baseball_landing(self, base_url: str, base_domain: str,
                                request_handler) -> Optional[str]:
         """Find a baseball sport landing page from the homepage."""
-        resp = request_handler.get(base_url)
-        if not resp:
+        links = self._get_links(base_url, request_handler)
+        if not links:
             return None
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        links = soup.find_all('a', href=True)
-
         candidates = []
-        for link in links:
-            href = link['href']
-            full_url = urljoin(base_url, href)
-            text = link.get_text(strip=True).lower()
-
-            if urlparse(full_url).netloc != base_domain:
+        for href, text in links:
+            full_url, link_domain = self._resolve_link(base_url, href)
+            if link_domain != base_domain:
                 continue
+            text = text.strip().lower()
 
             # Score the link as a baseball landing page
             score = 0
@@ -169,7 +208,7 @@ class UrlDiscoverer:
                     score += 1
 
             # Avoid roster/stats pages directly (we want the landing page)
-            if re.search(r'roster|stats|schedule|recruit', href, re.I):
+            if self.NOT_LANDING_RE.search(href):
                 score -= 1
 
             if score >= 2:
@@ -183,30 +222,27 @@ class UrlDiscoverer:
     def _scan_page_for_roster_stats(self, page_url: str, base_domain: str,
                                     request_handler) -> Optional[Dict[str, str]]:
         """Scan a baseball landing page specifically for roster and stats links."""
-        resp = request_handler.get(page_url)
-        if not resp:
+        links = self._get_links(page_url, request_handler)
+        if not links:
             return None
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        links = soup.find_all('a', href=True)
-
         roster_url = None
         stats_url = None
 
-        for link in links:
-            href = link['href']
-            full_url = urljoin(page_url, href)
-            text = link.get_text(strip=True).lower()
-            link_domain = urlparse(full_url).netloc
+        for href, text in links:
+            full_url, link_domain = self._resolve_link(page_url, href)
+            if full_url is None:
+                continue
+            text = text.strip().lower()
 
             # Look for roster link (same-domain only)
             if not roster_url and link_domain == base_domain:
-                if re.search(r'\broster\b', href, re.I) or re.search(r'\broster\b', text, re.I):
+                if self.ROSTER_WORD_RE.search(href) or self.ROSTER_WORD_RE.search(text):
                     roster_url = full_url
 
             # Look for stats link (allow related domains for cross-domain stats hosts)
             if not stats_url and self._is_related_domain(link_domain, base_domain):
-                if re.search(r'\bstat', href, re.I) or re.search(r'\bstat', text, re.I):
+                if self.STAT_WORD_RE.search(href) or self.STAT_WORD_RE.search(text):
                     stats_url = full_url
 
             if roster_url and stats_url:
@@ -224,32 +260,39 @@ class UrlDiscoverer:
         if not resp:
             return None
 
-        # Parse XML sitemap for baseball URLs
+        # Stream <loc> entries so we can stop as soon as both URLs turn up;
+        # malformed XML falls back to BeautifulSoup's forgiving parser
         try:
-            soup = BeautifulSoup(resp.text, 'lxml')
-        except Exception:
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            return self._match_sitemap_locs(self._iter_sitemap_locs(resp.content))
+        except etree.XMLSyntaxError:
+            soup = BeautifulSoup(resp.text, 'html.parser', parse_only=_LOCS_ONLY)
+            return self._match_sitemap_locs(
+                loc.get_text(strip=True) for loc in soup.find_all('loc'))
 
+    @staticmethod
+    def _iter_sitemap_locs(content: bytes):
+        """Yield each non-empty <loc> value from sitemap XML, incrementally."""
+        for _, elem in etree.iterparse(BytesIO(content), events=('end',), tag='{*}loc',
+                                       resolve_entities=False):
+            url_text = (elem.text or '').strip()
+            elem.clear()
+            if url_text:
+                yield url_text
+
+    def _match_sitemap_locs(self, locs) -> Optional[Dict[str, str]]:
+        """Pick the first roster and stats URLs from an iterable of sitemap URLs."""
         roster_url = None
         stats_url = None
 
-        # Look through all <loc> tags in sitemap
-        for loc in soup.find_all('loc'):
-            url_text = loc.get_text(strip=True)
+        for url_text in locs:
             if not url_text:
                 continue
 
-            for pattern in self.ROSTER_PATTERNS:
-                if pattern.search(url_text):
-                    if not roster_url:
-                        roster_url = url_text
-                    break
-
-            for pattern in self.STATS_PATTERNS:
-                if pattern.search(url_text):
-                    if not stats_url:
-                        stats_url = url_text
-                    break
+            if not roster_url and self.ROSTER_RE.search(url_text):
+                roster_url = url_text
+
+            if not stats_url and self.STATS_RE.search(url_text):
+                stats_url = url_text
 
             if roster_url and stats_url:
                 break
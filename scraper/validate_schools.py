@@ -16,6 +16,9 @@ Usage:
 """
 
 import argparse
+import asyncio
+import codecs
+import copy
 import csv
 import json
 import logging
@@ -23,14 +26,19 @@ import os
 import re
 import socket
 import sys
+import threading
 import time
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse, quote_plus
+from urllib.parse import urlparse, quote_plus, unquote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # Add parent dir so we can import sibling modules
@@ -40,6 +48,29 @@ from config import INITIAL_SCRAPE_CONFIG, ERROR_CONFIG
 from database import DatabaseManager
 from request_handler import ProtectedRequestHandler
 
+# aiodns is optional — without it DNS lookups run on a thread pool
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+# httpx is optional — conference probes share one HTTP/2 connection per host
+# when present, otherwise they go through the requests session
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# selectolax is optional — its lexbor parser walks conference-page anchors
+# much faster than BeautifulSoup; without it the anchor strainer is used
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_FETCH_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+
 load_dotenv(Path(__file__).parent.parent / '.env')
 
 logging.basicConfig(
@@ -49,6 +80,25 @@ logging.basicConfig(
 logger = logging.getLogger('validate_schools')
 
 
+class _DropRetryWarnings(logging.Filter):
+    """urllib3 warns on every connect retry; with hundreds of dead hosts that
+    buries the classification log. Its other warnings (e.g. a full
+    connection pool) still come through."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not str(record.msg).startswith('Retrying (')
+
+
+logging.getLogger('urllib3.connectionpool').addFilter(_DropRetryWarnings())
+
+
+@lru_cache(maxsize=16384)
+def _urlparse(url: str):
+    """Memoized urlparse for URLs seen repeatedly (school base URLs, hosts
+    being throttled or cached). One-shot hrefs should use urlparse directly."""
+    return urlparse(url)
+
+
 # ---------------------------------------------------------------------------
 # Classification enum
 # ---------------------------------------------------------------------------
@@ -81,11 +131,214 @@ PARKED_INDICATORS = [
     "domainmarket",
 ]
 
+# Homepages are read at most this far; parked pages give themselves away early
+MAX_PAGE_BYTES = 256 * 1024
+
+# Single pass over the page instead of one substring scan per indicator.
+# Case-insensitive so page text is scanned as-is, never copied to lowercase.
+_PARKED_RE = re.compile('|'.join(re.escape(s) for s in PARKED_INDICATORS), re.IGNORECASE)
+_PARKED_TAIL = max(len(s) for s in PARKED_INDICATORS) - 1
+_SPORTS_KEYWORDS_RE = re.compile(r'baseball|roster|schedule|athletics|sports', re.IGNORECASE)
+_BASEBALL_WORD_RE = re.compile('baseball', re.IGNORECASE)
+
+
+# Link scans only ever look at anchors — don't build the rest of the tree.
+# The strained soup's top-level children are exactly the matched anchors.
+_ANCHORS_ONLY = SoupStrainer('a', href=True)
+_BASEBALL_LINK_RE = re.compile(r'baseball|bsb|m-basebl')
+
+
+def _plausible_label(text: str) -> bool:
+    """Link text long enough to be a school name and short enough not to be prose."""
+    return bool(text) and 3 <= len(text) <= 80
+
+
+def _iter_links(html: str):
+    """Yield (href, label) for every <a href> on the page.
+
+    label is the link text, or the first <img alt> inside the link when the
+    text isn't a plausible name; None when neither is usable.
+    """
+    if LexborHTMLParser is not None:
+        for node in LexborHTMLParser(html).css('a[href]'):
+            text = node.text(strip=True)
+            if not _plausible_label(text):
+                img = node.css_first('img')
+                alt = img.attributes.get('alt') if img is not None else None
+                text = alt.strip() if alt else None
+            yield (node.attributes.get('href') or '').strip(), text
+        return
+
+    for link in BeautifulSoup(html, 'lxml', parse_only=_ANCHORS_ONLY):
+        text = link.get_text(strip=True)
+        if not _plausible_label(text):
+            img = link.find('img')
+            text = img['alt'].strip() if img and img.get('alt') else None
+        yield link.get('href', '').strip(), text
+
+
+def _read_page(resp, limit: int = MAX_PAGE_BYTES) -> tuple[str, str | None]:
+    """Stream at most ``limit`` bytes of a (stream=True) response body.
+
+    Returns (text, parked_indicator). Reading stops at the first parked
+    indicator; the connection is released either way.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(resp.encoding or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    parts = []
+    tail = ''  # carries indicators split across chunk boundaries
+    read = 0
+    try:
+        for chunk in resp.iter_content(chunk_size=16384):
+            read += len(chunk)
+            text = decoder.decode(chunk)
+            parts.append(text)
+            window = tail + text
+            match = _PARKED_RE.search(window)
+            if match:
+                return ''.join(parts), match.group(0).lower()
+            tail = window[-_PARKED_TAIL:]
+            if read >= limit:
+                break
+    finally:
+        resp.close()
+    return ''.join(parts), None
+
+
+def _has_sports_content(page_text: str, needed: int = 2) -> bool:
+    """True once ``needed`` distinct sports keywords appear in the page text."""
+    found = set()
+    for match in _SPORTS_KEYWORDS_RE.finditer(page_text):
+        found.add(match.group(0).lower())
+        if len(found) >= needed:
+            return True
+    return False
+
+
+# Per-lookup timeout (seconds) for the c-ares resolver
+DNS_TIMEOUT = 2.0
+# Lookups in flight at once (c-ares or the getaddrinfo thread pool)
+DNS_CONCURRENCY = 64
+
+# Requests allowed in flight to any one host; worker pools can be wide
+# because this, not the pool size, is what keeps us polite
+HOST_CONCURRENCY = 2
+CLASSIFY_WORKERS = 64
+# Domain-variation HEADs and candidate validation in DomainFixer
+FIX_WORKERS = 32
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+
+# One retry, and only for failures before the request reached the server
+# (e.g. a pooled keep-alive connection the host had already closed). Read
+# errors and statuses are never retried — callers treat them as signals.
+_CONNECT_RETRY = Retry(total=1, connect=1, read=0, status=0, other=0)
+
+
+def _make_session(pool_size: int, user_agent: str = USER_AGENT) -> requests.Session:
+    """Session whose connection pool matches the caller's peak concurrency.
+
+    pool_size should be the most requests the owner can have in flight at
+    once, so every host being probed keeps its pool (pool_connections) and
+    no connection is opened only to be discarded (pool_maxsize). Blocking
+    is a backstop should that ever be exceeded.
+    Accept-Encoding keeps requests' default, which adds br when brotli is
+    installed — advertising it otherwise would leave bodies undecodable."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          pool_block=True, max_retries=_CONNECT_RETRY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': user_agent})
+    return session
+
+
+class _HostThrottle:
+    """Per-host semaphores shared by every class in this module."""
+
+    def __init__(self, limit: int = HOST_CONCURRENCY):
+        self._limit = limit
+        self._lock = threading.Lock()
+        self._sems: dict[str, threading.Semaphore] = {}
+
+    def slot(self, url_or_host: str) -> threading.Semaphore:
+        """Semaphore for the URL's host — use as ``with throttle.slot(url):``."""
+        host = _urlparse(url_or_host).hostname if '://' in url_or_host else url_or_host
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = self._sems[host] = threading.Semaphore(self._limit)
+        return sem
+
+
+_host_throttle = _HostThrottle()
+
+
+# ---------------------------------------------------------------------------
+# DNS
+# ---------------------------------------------------------------------------
+
+# Hostname -> resolves, for the life of the process (many CSV rows and
+# domain-variation candidates share hosts)
+_dns_cache: dict[str, bool] = {}
+
+
+def _resolve_hostnames(hostnames) -> dict:
+    """Resolve each hostname (IPv4) once. Returns hostname -> bool."""
+    pending = [h for h in dict.fromkeys(hostnames) if h and h not in _dns_cache]
+    if pending:
+        if aiodns is not None:
+            _dns_cache.update(asyncio.run(_resolve_async(pending)))
+        else:
+            _dns_cache.update(_resolve_threaded(pending))
+    return {h: _dns_cache.get(h, False) for h in hostnames if h}
+
+
+async def _resolve_async(hostnames: list) -> dict:
+    """Resolve through c-ares, at most DNS_CONCURRENCY lookups in flight."""
+    resolver = aiodns.DNSResolver(timeout=DNS_TIMEOUT, tries=2)
+    semaphore = asyncio.Semaphore(DNS_CONCURRENCY)
+
+    async def lookup(hostname):
+        async with semaphore:
+            return await resolver.gethostbyname(hostname, socket.AF_INET)
+
+    answers = await asyncio.gather(*(lookup(h) for h in hostnames), return_exceptions=True)
+    return {h: not isinstance(a, Exception) for h, a in zip(hostnames, answers)}
+
+
+def _resolve_threaded(hostnames: list) -> dict:
+    """Fallback when aiodns isn't installed: getaddrinfo on a thread pool."""
+    def resolve(hostname):
+        try:
+            socket.getaddrinfo(hostname, None, socket.AF_INET, socket.SOCK_STREAM)
+            return hostname, True
+        except (socket.gaierror, socket.herror, OSError):
+            return hostname, False
+
+    with ThreadPoolExecutor(max_workers=DNS_CONCURRENCY) as executor:
+        return dict(executor.map(resolve, hostnames))
+
 
 # ---------------------------------------------------------------------------
 # SchoolValidator
 # ---------------------------------------------------------------------------
 
+# Probed when baseball is linked but the scraper still failed
+ROSTER_PROBE_PATHS = [
+    '/sports/baseball/roster',
+    '/sports/baseball/roster/2026',
+    '/sport/m-basebl/roster',
+    '/sports/bsb/roster',
+]
+ROSTER_PROBE_TIMEOUT = (3, 7)  # (connect, read)
+# A roster page bigger than this is real content, not an error stub
+ROSTER_MIN_BYTES = 1000
+
 class SchoolValidator:
     def __init__(self, schools_csv_path: str = None, db_manager: DatabaseManager = None):
         if schools_csv_path is None:
@@ -93,19 +346,27 @@ class SchoolValidator:
         self.schools_csv_path = schools_csv_path
         self.schools = self._load_csv(schools_csv_path)
         self.db = db_manager or DatabaseManager()
-        self.schools_in_db = self.db.get_schools_in_db()
+        # Frozen so membership stays a hashed lookup and the failed list
+        # computed from it can be memoized safely
+        self.schools_in_db = frozenset(self.db.get_schools_in_db())
+        self._failed_schools = None
+        # Homepage and roster probes for a school hit the same origin —
+        # keep-alive lets them share one connection. Each classify worker
+        # runs up to HOST_CONCURRENCY roster probes at once
+        self.session = _make_session(CLASSIFY_WORKERS * HOST_CONCURRENCY)
         logger.info(f"Loaded {len(self.schools)} schools from CSV, {len(self.schools_in_db)} already in DB")
 
     def _load_csv(self, path: str) -> list:
-        schools = []
-        with open(path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                schools.append(row)
-        return schools
+        # Rows stay dicts: they are carried whole into the classification
+        # report and the rescrape path, so a tuple layout would only move
+        # the dict construction downstream
+        return load_schools_csv(path)
 
     def get_failed_schools(self) -> list:
-        return [s for s in self.schools if s['school_name'] not in self.schools_in_db]
+        if self._failed_schools is None:
+            self._failed_schools = [s for s in self.schools
+                                    if s['school_name'] not in self.schools_in_db]
+        return self._failed_schools
 
     def classify_all(self, failed_schools: list) -> dict:
         """Classify all failed schools. Returns dict: school_name -> {classification, details, base_url}."""
@@ -125,7 +386,7 @@ class SchoolValidator:
                 dns_dead.append(school)
                 results[name] = {
                     'classification': SchoolClassification.DNS_DEAD,
-                    'details': f"DNS resolution failed for {urlparse(school['athletics_base_url']).hostname}",
+                    'details': f"DNS resolution failed for {_urlparse(school['athletics_base_url']).hostname}",
                     'base_url': school['athletics_base_url'],
                     'school': school,
                 }
@@ -134,53 +395,44 @@ class SchoolValidator:
 
         # Step 2: HTTP classification for DNS-reachable schools
         logger.info(f"Phase 2: HTTP classification for {len(dns_alive)} DNS-reachable schools...")
-        handler = ProtectedRequestHandler(INITIAL_SCRAPE_CONFIG, ERROR_CONFIG)
+        handler_config = {**INITIAL_SCRAPE_CONFIG, 'pool_size': CLASSIFY_WORKERS}
+        with ProtectedRequestHandler(handler_config, ERROR_CONFIG) as handler, \
+                ThreadPoolExecutor(max_workers=CLASSIFY_WORKERS) as executor:
+            futures = {
+                executor.submit(self._classify_school_throttled, school, handler): school
+                for school in dns_alive
+            }
+            for i, future in enumerate(as_completed(futures)):
+                name = futures[future]['school_name']
+                result = future.result()
+                results[name] = result
+                logger.info(f"  [{i+1}/{len(dns_alive)}] {name}: "
+                            f"{result['classification'].value} ({result['base_url']})")
 
-        for i, school in enumerate(dns_alive):
-            name = school['school_name']
-            base_url = school['athletics_base_url'].rstrip('/')
-            logger.info(f"  [{i+1}/{len(dns_alive)}] Classifying {name} ({base_url})")
+        return results
 
+    def _classify_school_throttled(self, school: dict, handler: ProtectedRequestHandler) -> dict:
+        """Classify one school inside its host's throttle slot.
+        The courtesy delay is per host, so distinct hosts proceed in parallel."""
+        base_url = school['athletics_base_url'].rstrip('/')
+        with _host_throttle.slot(base_url):
             result = self._classify_school(school, base_url, handler)
-            results[name] = result
-
-            # Brief delay between requests
             time.sleep(0.5)
-
-        return results
+        return result
 
     def _parallel_dns(self, schools: list) -> dict:
         """Resolve DNS for all schools in parallel. Returns dict: school_name -> bool."""
-        results = {}
-
-        def resolve(school):
-            name = school['school_name']
-            url = school['athletics_base_url']
-            hostname = urlparse(url).hostname
-            if not hostname:
-                return name, False
-            try:
-                socket.getaddrinfo(hostname, None, socket.AF_INET, socket.SOCK_STREAM)
-                return name, True
-            except (socket.gaierror, socket.herror, OSError):
-                return name, False
-
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = {executor.submit(resolve, s): s for s in schools}
-            for future in as_completed(futures):
-                name, alive = future.result()
-                results[name] = alive
-
-        return results
+        hostnames = {s['school_name']: _urlparse(s['athletics_base_url']).hostname for s in schools}
+        alive = _resolve_hostnames(hostnames.values())
+        return {name: bool(host) and alive.get(host, False) for name, host in hostnames.items()}
 
     def _classify_school(self, school: dict, base_url: str, handler: ProtectedRequestHandler) -> dict:
         """Classify a single DNS-reachable school by HTTP probing."""
         name = school['school_name']
 
         try:
-            resp = requests.get(base_url, timeout=10, allow_redirects=True, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            })
+            resp = self.session.get(base_url, timeout=10, allow_redirects=True, stream=True)
+            html, indicator = _read_page(resp)
         except requests.exceptions.SSLError as e:
             return {
                 'classification': SchoolClassification.SSL_ERROR,
@@ -211,11 +463,12 @@ class SchoolValidator:
             }
 
         # Check for redirect to different host
-        original_host = urlparse(base_url).hostname
-        final_host = urlparse(resp.url).hostname
+        original_host = _urlparse(base_url).hostname
+        final = urlparse(resp.url)
+        final_host = final.hostname
         if original_host and final_host and original_host != final_host:
             # Redirect to a different domain
-            new_base = f"{urlparse(resp.url).scheme}://{final_host}"
+            new_base = f"{final.scheme}://{final_host}"
             return {
                 'classification': SchoolClassification.REDIRECT_DOMAIN,
                 'details': f"Redirects to {final_host} (was {original_host})",
@@ -242,18 +495,16 @@ class SchoolValidator:
             }
 
         # Check page content for parked indicators
-        page_text = resp.text.lower()
-        for indicator in PARKED_INDICATORS:
-            if indicator in page_text:
-                return {
-                    'classification': SchoolClassification.PARKED_DOMAIN,
-                    'details': f"Parked domain (matched: '{indicator}')",
-                    'base_url': base_url,
-                    'school': school,
-                }
+        if indicator:
+            return {
+                'classification': SchoolClassification.PARKED_DOMAIN,
+                'details': f"Parked domain (matched: '{indicator}')",
+                'base_url': base_url,
+                'school': school,
+            }
 
         # Check for baseball references
-        has_baseball = self._check_for_baseball(resp.text, base_url)
+        has_baseball = self._check_for_baseball(html, base_url)
         if not has_baseball:
             return {
                 'classification': SchoolClassification.NO_BASEBALL,
@@ -264,28 +515,17 @@ class SchoolValidator:
 
         # Baseball exists but scraper still failed — wrong URLs or zero players
         # Try fetching a roster page to distinguish
-        roster_paths = [
-            '/sports/baseball/roster',
-            '/sports/baseball/roster/2026',
-            '/sport/m-basebl/roster',
-            '/sports/bsb/roster',
-        ]
-        for path in roster_paths:
-            try:
-                roster_url = f"{base_url}{path}"
-                r = requests.get(roster_url, timeout=10, allow_redirects=True, headers={
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                })
-                if r.status_code == 200 and len(r.text) > 1000:
-                    # Page loads but scraper couldn't parse it → likely JS-rendered
-                    return {
-                        'classification': SchoolClassification.ZERO_PLAYERS,
-                        'details': f"Roster page loads ({path}) but scraper found 0 players (likely JS-rendered)",
-                        'base_url': base_url,
-                        'school': school,
-                    }
-            except requests.exceptions.RequestException:
-                continue
+        path = _first_passing(ROSTER_PROBE_PATHS,
+                              lambda p: self._roster_page_loads(f"{base_url}{p}"),
+                              max_workers=HOST_CONCURRENCY)
+        if path:
+            # Page loads but scraper couldn't parse it → likely JS-rendered
+            return {
+                'classification': SchoolClassification.ZERO_PLAYERS,
+                'details': f"Roster page loads ({path}) but scraper found 0 players (likely JS-rendered)",
+                'base_url': base_url,
+                'school': school,
+            }
 
         return {
             'classification': SchoolClassification.WRONG_URLS,
@@ -294,36 +534,108 @@ class SchoolValidator:
             'school': school,
         }
 
+    def _roster_page_loads(self, url: str) -> bool:
+        """HEAD, then stream just enough of the GET to see a non-trivial page.
+        Runs inside the caller's host slot, so it doesn't take another."""
+        try:
+            head = self.session.head(url, timeout=ROSTER_PROBE_TIMEOUT, allow_redirects=True)
+            if head.status_code >= 400 and head.status_code not in (405, 501):
+                return False
+            with self.session.get(url, timeout=ROSTER_PROBE_TIMEOUT,
+                                  allow_redirects=True, stream=True) as r:
+                if r.status_code != 200:
+                    return False
+                read = 0
+                for chunk in r.iter_content(chunk_size=1024):
+                    read += len(chunk)
+                    if read > ROSTER_MIN_BYTES:
+                        return True
+                return False
+        except requests.exceptions.RequestException:
+            return False
+
     def _check_for_baseball(self, html: str, base_url: str) -> bool:
         """Check if the page has baseball-related content in nav/links."""
-        soup = BeautifulSoup(html, 'lxml')
-        # Check links for baseball references
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').lower()
-            text = link.get_text(strip=True).lower()
-            if 'baseball' in href or 'baseball' in text:
-                return True
-            if 'bsb' in href or 'm-basebl' in href:
-                return True
-
-        # Check full text as fallback
-        text = soup.get_text(separator=' ').lower()
-        if 'baseball' in text:
+        # The word anywhere in the markup covers link hrefs and text too,
+        # so only pages without it need the anchor parse
+        if _BASEBALL_WORD_RE.search(html):
             return True
+        # SIDEARM-style abbreviated sport slugs only show up in link targets
+        soup = BeautifulSoup(html, 'lxml', parse_only=_ANCHORS_ONLY)
+        return any(_BASEBALL_LINK_RE.search(link.get('href', '').lower())
+                   for link in soup)
 
-        return False
+
+# ---------------------------------------------------------------------------
+# Validation cache
+# ---------------------------------------------------------------------------
+
+# Domain validations keyed by (kind, scheme, host): paths on one host validate
+# the same, and DuckDuckGo, domain-variation and conference candidates overlap
+VALIDATE_CACHE_TTL = 3600
+_validate_cache: dict[tuple, tuple[float, object]] = {}
+
+
+def _cached_validation(kind: str, url: str, check):
+    """Return check(url), reusing a result for the same host from the last hour."""
+    parsed = _urlparse(url)
+    key = (kind, parsed.scheme, parsed.hostname)
+    now = time.monotonic()
+    entry = _validate_cache.get(key)
+    if entry and now - entry[0] < VALIDATE_CACHE_TTL:
+        return entry[1]
+    with _host_throttle.slot(parsed.hostname or url):
+        result = check(url)
+    _validate_cache[key] = (now, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
 # DomainFixer
 # ---------------------------------------------------------------------------
 
+# DuckDuckGo result hrefs carry the real URL in the uddg= query parameter
+_UDDG_RE = re.compile(r'[?&]uddg=([^&]+)')
+_ATHLETICS_HOST_HINTS = ('.edu', 'athletics', 'sports', 'sidearmsports')
+
+
+def _candidate_rank(url: str) -> tuple:
+    """Sort key putting .edu hosts first, then SIDEARM-hosted ones."""
+    host = _urlparse(url).hostname or ''
+    return (not host.endswith('.edu'), 'sidearmsports' not in host, url)
+
+
+def _first_passing(candidates: list, check, max_workers: int = 32):
+    """Run ``check`` over candidates concurrently; return the earliest candidate
+    in list order that passes, or None. Checks still queued once it is known
+    are cancelled."""
+    if not candidates:
+        return None
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)))
+    try:
+        futures = [executor.submit(check, c) for c in candidates]
+        for candidate, future in zip(candidates, futures):
+            if future.result():
+                return candidate
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _head_ok(session: requests.Session, url: str, timeout: float = 5) -> bool:
+    """HEAD pre-check: the URL answers without a client/server error."""
+    try:
+        with _host_throttle.slot(url):
+            resp = session.head(url, timeout=timeout, allow_redirects=True)
+    except requests.exceptions.RequestException:
+        return False
+    # Some servers refuse HEAD outright — let the full GET decide for those
+    return resp.status_code < 400 or resp.status_code in (405, 501)
+
+
 class DomainFixer:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session = _make_session(FIX_WORKERS)
 
     def fix_domains(self, classified_schools: dict) -> list:
         """Try to find correct domains for fixable schools.
@@ -381,7 +693,7 @@ class DomainFixer:
     def _try_domain_variations(self, name: str, info: dict) -> dict | None:
         """Try common domain name variations."""
         old_url = info['base_url']
-        hostname = urlparse(old_url).hostname
+        hostname = _urlparse(old_url).hostname
         if not hostname:
             return None
 
@@ -414,18 +726,23 @@ class DomainFixer:
         # Remove the original domain from variations
         variations.discard(hostname)
 
-        for variation in variations:
-            url = f"https://{variation}"
-            if self._validate_athletics_domain(url):
-                return {
-                    'school_name': name,
-                    'old_url': old_url,
-                    'new_url': url,
-                    'method': 'domain_variation',
-                    'confidence': 'medium',
-                }
-            time.sleep(0.3)
+        # Cheap filters before any full GET: most guesses don't resolve,
+        # and many that do answer HEAD with a 4xx/5xx
+        resolves = _resolve_hostnames(variations)
+        urls = [f"https://{v}" for v in sorted(variations) if resolves.get(v)]
+        with ThreadPoolExecutor(max_workers=FIX_WORKERS) as executor:
+            checks = executor.map(lambda u: _head_ok(self.session, u), urls)
+            reachable = [u for u, ok in zip(urls, checks) if ok]
 
+        url = _first_passing(reachable, self._validate_athletics_domain, max_workers=FIX_WORKERS)
+        if url:
+            return {
+                'school_name': name,
+                'old_url': old_url,
+                'new_url': url,
+                'method': 'domain_variation',
+                'confidence': 'medium',
+            }
         return None
 
     def _try_duckduckgo_search(self, name: str, info: dict) -> dict | None:
@@ -440,60 +757,46 @@ class DomainFixer:
         except requests.exceptions.RequestException:
             return None
 
-        soup = BeautifulSoup(resp.text, 'lxml')
+        soup = BeautifulSoup(resp.text, 'lxml', parse_only=_ANCHORS_ONLY)
 
-        # Parse result links — DuckDuckGo HTML results are in <a class="result__a">
+        # One pass over every link: DuckDuckGo results (<a class="result__a">)
+        # on .edu/athletics-looking hosts, plus any link mentioning baseball
         candidates = set()
-        for link in soup.find_all('a', class_='result__a'):
-            href = link.get('href', '')
+        for link in soup:
+            href = link['href']
             # DuckDuckGo wraps URLs; extract the actual URL
-            if 'uddg=' in href:
-                from urllib.parse import parse_qs
-                parsed = urlparse(href)
-                qs = parse_qs(parsed.query)
-                if 'uddg' in qs:
-                    href = qs['uddg'][0]
+            match = _UDDG_RE.search(href)
+            if match:
+                href = unquote_plus(match.group(1))
 
             parsed = urlparse(href)
-            if not parsed.hostname:
+            host = parsed.hostname
+            if not host:
                 continue
 
-            host = parsed.hostname
-            # Prefer .edu or known athletics domains
-            if any(pat in host for pat in ['.edu', 'athletics', 'sports', 'sidearmsports']):
-                base = f"{parsed.scheme}://{host}"
-                candidates.add(base)
-
-        # Also check all links on the page
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if 'uddg=' in href:
-                from urllib.parse import parse_qs
-                parsed = urlparse(href)
-                qs = parse_qs(parsed.query)
-                if 'uddg' in qs:
-                    href = qs['uddg'][0]
-            parsed = urlparse(href)
-            if parsed.hostname and 'baseball' in href.lower():
-                base = f"{parsed.scheme}://{parsed.hostname}"
-                candidates.add(base)
+            is_result = 'result__a' in link.get('class', ())
+            if (is_result and any(pat in host for pat in _ATHLETICS_HOST_HINTS)) \
+                    or 'baseball' in href.lower():
+                candidates.add(f"{parsed.scheme}://{host}")
 
-        old_host = urlparse(info['base_url']).hostname
+        old_host = _urlparse(info['base_url']).hostname
         candidates.discard(info['base_url'])
 
-        for candidate in candidates:
-            candidate_host = urlparse(candidate).hostname
-            if candidate_host == old_host:
-                continue
-            if self._validate_athletics_domain(candidate):
-                return {
-                    'school_name': name,
-                    'old_url': info['base_url'],
-                    'new_url': candidate,
-                    'method': 'duckduckgo_search',
-                    'confidence': 'medium',
-                }
-            time.sleep(0.3)
+        # Candidates are distinct hosts — validate them concurrently, most
+        # likely first (.edu, then SIDEARM-hosted), and take the first that passes
+        candidates = sorted(
+            (c for c in candidates if urlparse(c).hostname != old_host),
+            key=_candidate_rank,
+        )
+        winner = _first_passing(candidates, self._validate_athletics_domain, max_workers=FIX_WORKERS)
+        if winner:
+            return {
+                'school_name': name,
+                'old_url': info['base_url'],
+                'new_url': winner,
+                'method': 'duckduckgo_search',
+                'confidence': 'medium',
+            }
 
         # Brief delay between DuckDuckGo searches to be polite
         time.sleep(1.0)
@@ -501,22 +804,23 @@ class DomainFixer:
 
     def _validate_athletics_domain(self, url: str) -> bool:
         """Check if a URL points to a working athletics site with baseball content."""
+        return _cached_validation('athletics', url, self._check_athletics_domain)
+
+    def _check_athletics_domain(self, url: str) -> bool:
+        """Uncached body of _validate_athletics_domain."""
         try:
-            resp = self.session.get(url, timeout=10, allow_redirects=True)
+            resp = self.session.get(url, timeout=10, allow_redirects=True, stream=True)
             if resp.status_code != 200:
+                resp.close()
                 return False
 
-            text = resp.text.lower()
-            # Check it's not a parked page
-            for indicator in PARKED_INDICATORS:
-                if indicator in text:
-                    return False
+            # Parked pages stop the download at the first indicator
+            html, parked = _read_page(resp)
+            if parked:
+                return False
 
             # Check for athletics/sports content
-            soup = BeautifulSoup(resp.text, 'lxml')
-            sports_keywords = ['baseball', 'roster', 'schedule', 'athletics', 'sports']
-            found = sum(1 for kw in sports_keywords if kw in text)
-            return found >= 2
+            return _has_sports_content(html)
 
         except requests.exceptions.RequestException:
             return False
@@ -615,6 +919,44 @@ IGNORE_DOMAINS = {
 }
 
 
+# Hosts containing any of these are shops, ticketing, CDNs or trackers
+_SKIP_HOST_WORDS = ('ticketmaster', 'vivenu', 'shopify', 'merch',
+                    'cdninstagram', 'cloudflare', 'scorecardresearch',
+                    'transcend', 'tinyurl', 'statbroadcast')
+
+# Rejects an absolute href before urlparse when its host is (a subdomain of)
+# an IGNORE_DOMAINS entry or contains a _SKIP_HOST_WORDS word. Anchored to the
+# authority so the names can't match in a path or query string.
+_IGNORED_LINK_RE = re.compile(
+    r'^(?:[a-z][a-z0-9+.\-]*:)?//(?:[^/?#@]*@)?(?:'
+    r'(?:[^/?#@:]*\.)?(?:' + '|'.join(re.escape(d) for d in sorted(IGNORE_DOMAINS)) + r')'
+    r'(?::\d*)?(?:[/?#]|$)'
+    r'|[^/?#@:]*(?:' + '|'.join(_SKIP_HOST_WORDS) + r'))',
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=4096)
+def _external_base_url(href: str) -> str | None:
+    """scheme://host for an absolute href, or None when it has no host or
+    points at an ignored domain. Memoized: conference pages share nav and
+    footer links, and each conference is fetched at several paths."""
+    # Socials, trackers, shops — dropped without parsing
+    if _IGNORED_LINK_RE.match(href):
+        return None
+    parsed = urlparse(href)
+    if not parsed.hostname:
+        return None
+    return f"{parsed.scheme or 'https'}://{parsed.hostname}"
+
+
+# Link labels that are site furniture rather than a school name
+_SKIP_LABEL_RE = re.compile(
+    r'ticket|shop|store|donate|stream|watch|follow|app|privacy|terms|'
+    r'copyright|service|sidearm|powered',
+    re.IGNORECASE,
+)
+
+
 def _get_conference_url(conference: str, division: str) -> str | None:
     """Look up conference website URL, handling division-qualified keys."""
     # Try division-qualified key first (for MIAA, GNAC which differ by division)
@@ -626,36 +968,105 @@ def _get_conference_url(conference: str, division: str) -> str | None:
     return None
 
 
+_NAME_SUFFIXES = (' university', ' college', ' institute of technology')
+_PAREN_RE = re.compile(r'\s*\([^)]*\)')
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+_NON_ALPHA_RE = re.compile(r'[^a-z]')
+# Opening of a SIDEARM embedded "data":[...] array
+_DATA_ARRAY_RE = re.compile(r'"data"\s*:\s*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=8192)
 def _normalize_name(name: str) -> str:
-    """Normalize a school name for fuzzy matching."""
+    """Normalize a school name for fuzzy matching.
+    Memoized: the matcher re-normalizes every missing name per extracted school."""
     n = name.lower().strip()
-    # Remove common suffixes
-    for suffix in [' university', ' college', ' institute of technology']:
+    # Remove common suffixes (anywhere — "X College of Y" loses it too)
+    for suffix in _NAME_SUFFIXES:
         n = n.replace(suffix, '')
     # Expand abbreviations
     n = n.replace('st.', 'state').replace('mt.', 'mount')
     # Remove parenthetical state qualifiers
-    n = re.sub(r'\s*\([^)]*\)', '', n)
+    n = _PAREN_RE.sub('', n)
     # Remove punctuation
-    n = re.sub(r'[^a-z0-9\s]', '', n)
+    n = _NONALNUM_RE.sub('', n)
     # Collapse whitespace
-    n = re.sub(r'\s+', ' ', n).strip()
+    n = _WS_RE.sub(' ', n).strip()
     return n
 
 
+class _MissingIndex:
+    """One conference's missing school names, keyed for _match_to_missing.
+
+    Keys are computed once per conference rather than once per extracted
+    school. Every map keeps names in insertion order, so lookups return the
+    same school a linear scan over the names would.
+    """
+
+    def __init__(self, names):
+        self.keys: dict[str, tuple[str, list, str]] = {}  # name -> (norm, words, slug)
+        self.by_norm: dict[str, list] = defaultdict(list)
+        self.by_first_word: dict[str, list] = defaultdict(list)
+        for name in names:
+            norm = _normalize_name(name)
+            words = norm.split()
+            self.keys[name] = (norm, words, _NON_ALPHA_RE.sub('', norm))
+            self.by_norm[norm].append(name)
+            if words and len(words[0]) > 3:
+                self.by_first_word[words[0]].append(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def discard(self, name: str):
+        entry = self.keys.pop(name, None)
+        if entry is None:
+            return
+        norm, words, _ = entry
+        self.by_norm[norm].remove(name)
+        if words and len(words[0]) > 3:
+            self.by_first_word[words[0]].remove(name)
+
+
 # ---------------------------------------------------------------------------
 # ConferenceDiscoverer
 # ---------------------------------------------------------------------------
 
+# Conference candidates only need a parked check — parked pages show it early
+PARKED_SCAN_BYTES = 64 * 1024
+VALIDATE_WORKERS = 32
+
 class ConferenceDiscoverer:
     """Scrape conference websites to find correct athletics URLs for missing schools."""
 
+    USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                  'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                          'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = _make_session(VALIDATE_WORKERS, self.USER_AGENT)
+        # Each conference gets several same-host probes; over HTTP/2 the
+        # parallel HEADs multiplex on one connection instead of opening more
+        self.client = None
+        if HTTPX_AVAILABLE:
+            try:
+                self.client = httpx.Client(
+                    http2=True, follow_redirects=True,
+                    headers={'User-Agent': self.USER_AGENT},
+                    timeout=httpx.Timeout(15.0, connect=5.0),
+                )
+            except ImportError:
+                # httpx without the h2 extra
+                logger.debug("h2 not installed; conference probes use requests")
+
+    def close(self):
+        self.session.close()
+        if self.client is not None:
+            self.client.close()
 
     def discover_all(self, classifications: dict, csv_schools: list) -> list:
         """Scrape conference sites for schools with incorrect URLs.
@@ -683,7 +1094,8 @@ class ConferenceDiscoverer:
             norm = _normalize_name(school['school_name'])
             name_lookup[norm] = school['school_name']
             # Also index by just the first word for short-name matching
-            first_word = norm.split()[0] if norm.split() else ''
+            parts = norm.split()
+            first_word = parts[0] if parts else ''
             if first_word and len(first_word) > 3:
                 if first_word not in name_lookup:
                     name_lookup[first_word] = school['school_name']
@@ -701,7 +1113,8 @@ class ConferenceDiscoverer:
                 continue
 
             logger.info(f"  [{conferences_scraped}/{total_confs}] Scraping {conf} ({conf_url})...")
-            school_urls = self._scrape_conference(conf, conf_url)
+            missing_index = _MissingIndex(s['name'] for s in missing_schools)
+            school_urls = self._scrape_conference(conf, conf_url, missing_index)
 
             if not school_urls:
                 logger.info(f"    No school URLs extracted from {conf}")
@@ -710,12 +1123,19 @@ class ConferenceDiscoverer:
             logger.info(f"    Found {len(school_urls)} school URLs on {conf} site")
 
             # Match extracted URLs to our missing schools
-            missing_names = {s['name'] for s in missing_schools}
             old_url_map = {s['name']: s['old_url'] for s in missing_schools}
 
+            # Validate every URL that could match concurrently up front; the
+            # ordered loop below then reads results from the validation cache.
+            # Removing names only ever shrinks the matches, so this covers it.
+            self._validate_urls([
+                url for name, url in school_urls.items()
+                if self._match_to_missing(name, url, missing_index, name_lookup)
+            ])
+
             for extracted_name, extracted_url in school_urls.items():
                 matched_name = self._match_to_missing(
-                    extracted_name, extracted_url, missing_names, name_lookup
+                    extracted_name, extracted_url, missing_index, name_lookup
                 )
                 if matched_name:
                     # Validate the URL actually works
@@ -728,41 +1148,76 @@ class ConferenceDiscoverer:
                             'method': 'conference_site',
                             'confidence': 'high',
                         })
-                        missing_names.discard(matched_name)
+                        missing_index.discard(matched_name)
                         logger.info(f"    -> Matched: {matched_name} = {validated_url}")
 
             time.sleep(1.0)  # courtesy delay between conferences
 
         return fixes
 
-    def _scrape_conference(self, conf: str, conf_url: str) -> dict:
-        """Fetch conference pages and extract school name → URL pairs."""
+    def _scrape_conference(self, conf: str, conf_url: str,
+                           missing_index: _MissingIndex = None) -> dict:
+        """Fetch conference pages and extract school name → URL pairs.
+        With missing_index, stops as soon as every missing school has a link
+        under its own name."""
         all_school_urls = {}
-        conf_host = urlparse(conf_url).hostname
-
-        for path in CONFERENCE_MEMBER_PATHS:
-            url = conf_url.rstrip('/') + path
-            try:
-                resp = self.session.get(url, timeout=15, allow_redirects=True)
-                if resp.status_code != 200:
-                    continue
-            except requests.exceptions.RequestException:
+        conf_host = _urlparse(conf_url).hostname
+        # Missing schools not yet seen by name; emptied by _extract_school_urls
+        pending = _MissingIndex(missing_index.keys) if missing_index is not None else None
+
+        # Probe every candidate path with HEAD up front so misses cost no body;
+        # survivors keep CONFERENCE_MEMBER_PATHS order for the GETs below
+        urls = [conf_url.rstrip('/') + path for path in CONFERENCE_MEMBER_PATHS]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            checks = executor.map(self._conference_head_ok, urls)
+            good_urls = [u for u, ok in zip(urls, checks) if ok]
+
+        # Same host over one keep-alive connection — no delay between paths
+        for url in good_urls:
+            html = self._conference_get(url)
+            if html is None:
                 continue
 
-            school_urls = self._extract_school_urls(resp.text, conf_host)
+            school_urls = self._extract_school_urls(html, conf_host, pending)
             all_school_urls.update(school_urls)
 
             # If we found a decent number of schools, don't need to try more paths
-            if len(all_school_urls) >= 8:
+            if len(all_school_urls) >= 8 or (pending is not None and not pending):
                 break
 
-            time.sleep(0.5)
-
         return all_school_urls
 
-    def _extract_school_urls(self, html: str, conf_host: str) -> dict:
+    def _conference_head_ok(self, url: str) -> bool:
+        """_head_ok over the HTTP/2 client when there is one."""
+        if self.client is None:
+            return _head_ok(self.session, url)
+        try:
+            with _host_throttle.slot(url):
+                resp = self.client.head(url, timeout=5)
+        except httpx.HTTPError:
+            return False
+        return resp.status_code < 400 or resp.status_code in (405, 501)
+
+    def _conference_get(self, url: str) -> str | None:
+        """Body of a conference page, or None on any failure or non-200."""
+        try:
+            with _host_throttle.slot(url):
+                if self.client is not None:
+                    resp = self.client.get(url)
+                else:
+                    resp = self.session.get(url, timeout=15, allow_redirects=True)
+        except _FETCH_ERRORS:
+            return None
+        if resp.status_code != 200:
+            return None
+        return resp.text
+
+    def _extract_school_urls(self, html: str, conf_host: str,
+                             pending: _MissingIndex = None) -> dict:
         """Parse HTML to find school name → athletics URL pairs.
-        Tries three strategies: SIDEARM JSON data, <a> tag extraction, raw URL regex."""
+        Tries three strategies: SIDEARM JSON data, <a> tag extraction, raw URL regex.
+        Names in pending are discarded as a link with the same name turns up;
+        once it is empty, the remaining links are skipped."""
         school_urls = {}
 
         # Strategy 1: SIDEARM JSON — conference sites embed school data as JSON
@@ -770,79 +1225,69 @@ class ConferenceDiscoverer:
         json_schools = self._extract_sidearm_json(html)
         if json_schools:
             school_urls.update(json_schools)
+            if pending is not None:
+                for name in json_schools:
+                    self._claim_pending(pending, name)
+                if not pending:
+                    return school_urls
 
         # Strategy 2: Standard <a> tag extraction
-        soup = BeautifulSoup(html, 'lxml')
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').strip()
+        seen_urls = set(school_urls.values())
+        for href, text in _iter_links(html):
             if not href or href.startswith('#') or href.startswith('javascript'):
                 continue
-
-            parsed = urlparse(href)
-            host = parsed.hostname
-            if not host:
+            base_url = _external_base_url(href)
+            if base_url is None:
                 continue
 
-            # Skip internal / non-athletics links
+            # Skip internal links
+            host = base_url.split('://', 1)[1]
             if conf_host and host.replace('www.', '') == conf_host.replace('www.', ''):
                 continue
-            base_host = '.'.join(host.rsplit('.', 2)[-2:]) if '.' in host else host
-            if base_host in IGNORE_DOMAINS:
-                continue
-            if any(x in host for x in ['ticketmaster', 'vivenu', 'shopify', 'merch',
-                                        'cdninstagram', 'cloudflare', 'scorecardresearch',
-                                        'transcend', 'tinyurl', 'statbroadcast']):
-                continue
-
-            scheme = parsed.scheme or 'https'
-            base_url = f"{scheme}://{host}"
 
-            # Get school name from link text or img alt
-            text = link.get_text(strip=True)
-            if not text or len(text) < 3 or len(text) > 80:
-                img = link.find('img')
-                if img and img.get('alt'):
-                    text = img['alt'].strip()
-                else:
-                    continue
+            # School name comes from the link text or img alt
+            if not text:
+                continue
 
-            if any(x in text.lower() for x in ['ticket', 'shop', 'store', 'donate',
-                                                 'stream', 'watch', 'follow', 'app',
-                                                 'privacy', 'terms', 'copyright',
-                                                 'service', 'sidearm', 'powered']):
+            if _SKIP_LABEL_RE.search(text):
                 continue
 
-            if base_url not in {v for v in school_urls.values()}:
+            if base_url not in seen_urls:
                 school_urls[text] = base_url
+                seen_urls.add(base_url)
+                if pending is not None:
+                    self._claim_pending(pending, text)
+                    if not pending:
+                        break
 
         return school_urls
 
+    def _claim_pending(self, pending: _MissingIndex, name: str):
+        """Drop the missing school with exactly this name (after normalization).
+
+        The fuzzy strategies in _match_to_missing are left out on purpose: a
+        loose match here would end the scan before the real link was seen.
+        """
+        if name in pending:
+            pending.discard(name)
+            return
+        same_norm = pending.by_norm.get(_normalize_name(name))
+        if same_norm:
+            pending.discard(same_norm[0])
+
     def _extract_sidearm_json(self, html: str) -> dict:
         """Extract school name → URL pairs from SIDEARM embedded JSON data.
         SIDEARM conference sites embed school objects in "data":[...] arrays
         with title, athletics_website, and other fields."""
         school_urls = {}
 
-        # Find "data":[ positions and extract the full JSON array via bracket counting
-        for match in re.finditer(r'"data"\s*:\s*\[', html):
-            start = match.end() - 1  # include the opening [
-            depth = 0
-            end = start
-            for i in range(start, min(start + 100000, len(html))):
-                if html[i] == '[':
-                    depth += 1
-                elif html[i] == ']':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-
-            if end <= start:
-                continue
-
+        # Find "data":[ positions and decode the JSON array that starts there
+        for match in _DATA_ARRAY_RE.finditer(html):
+            # Decode straight from the offset — the decoder finds the end
+            # of the array itself, brackets inside strings included
             try:
-                arr = json.loads(html[start:end])
-            except (json.JSONDecodeError, ValueError):
+                arr, _ = _JSON_DECODER.raw_decode(html, match.end() - 1)
+            except ValueError:
                 continue
 
             if not isinstance(arr, list):
@@ -865,61 +1310,79 @@ class ConferenceDiscoverer:
         return school_urls
 
     def _match_to_missing(self, extracted_name: str, extracted_url: str,
-                          missing_names: set, name_lookup: dict) -> str | None:
+                          missing_index: _MissingIndex, name_lookup: dict) -> str | None:
         """Match an extracted school name/URL to one of our missing schools."""
         # Strategy 1: Exact match
-        if extracted_name in missing_names:
+        if extracted_name in missing_index:
             return extracted_name
 
         # Strategy 2: Normalized match
         norm_extracted = _normalize_name(extracted_name)
-        for missing_name in missing_names:
-            norm_missing = _normalize_name(missing_name)
-            if norm_extracted == norm_missing:
-                return missing_name
+        same_norm = missing_index.by_norm.get(norm_extracted)
+        if same_norm:
+            return same_norm[0]
 
         # Strategy 3: Substring/containment match
-        for missing_name in missing_names:
-            norm_missing = _normalize_name(missing_name)
+        # Handle "IUP" / "Indiana (PA)" style — names sharing the first significant word
+        extracted_words = norm_extracted.split()
+        same_first = missing_index.by_first_word.get(extracted_words[0]) if extracted_words else None
+        same_first = set(same_first) if same_first else ()
+        for missing_name, (norm_missing, _, _) in missing_index.keys.items():
             # "fort valley state" in "fort valley state university"
             if norm_missing in norm_extracted or norm_extracted in norm_missing:
                 return missing_name
-            # Handle "IUP" / "Indiana (PA)" style — check if first significant word matches
-            missing_words = norm_missing.split()
-            extracted_words = norm_extracted.split()
-            if missing_words and extracted_words:
-                if missing_words[0] == extracted_words[0] and len(missing_words[0]) > 3:
-                    return missing_name
+            if missing_name in same_first:
+                return missing_name
 
         # Strategy 4: URL hostname matching — compare extracted URL to the missing schools' old URLs
-        extracted_host = urlparse(extracted_url).hostname or ''
-        for missing_name in missing_names:
-            # Build slug from school name and check if it's in the hostname
-            slug = re.sub(r'[^a-z]', '', _normalize_name(missing_name))
-            if slug and len(slug) > 4 and slug in extracted_host.replace('.', ''):
+        extracted_host = (_urlparse(extracted_url).hostname or '').replace('.', '')
+        for missing_name, (_, _, slug) in missing_index.keys.items():
+            # Slug of the school name appearing in the hostname
+            if slug and len(slug) > 4 and slug in extracted_host:
                 return missing_name
 
         return None
 
+    def _validate_urls(self, urls: list) -> dict:
+        """Run _validate_url over urls concurrently. Returns url -> result."""
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(VALIDATE_WORKERS, len(unique))) as executor:
+            return dict(zip(unique, executor.map(self._validate_url, unique)))
+
     def _validate_url(self, url: str) -> str | None:
         """Check URL resolves and isn't parked. Returns final URL after redirects."""
+        return _cached_validation('url', url, self._check_url)
+
+    def _get_prefix(self, url: str) -> requests.Response:
+        """Streaming GET for just the head of the page. Servers that honour
+        Range stop sending there, so the connection goes back to the pool
+        instead of being dropped mid-body."""
+        return self.session.get(url, timeout=10, allow_redirects=True, stream=True,
+                                headers={'Range': f'bytes=0-{PARKED_SCAN_BYTES - 1}'})
+
+    def _check_url(self, url: str) -> str | None:
+        """Uncached body of _validate_url."""
         try:
-            resp = self.session.get(url, timeout=10, allow_redirects=True)
-            if resp.status_code != 200:
+            resp = self._get_prefix(url)
+            if resp.status_code not in (200, 206):
+                resp.close()
                 # Try https if http failed
                 if url.startswith('http://'):
                     url_https = url.replace('http://', 'https://', 1)
-                    resp = self.session.get(url_https, timeout=10, allow_redirects=True)
-                    if resp.status_code != 200:
+                    resp = self._get_prefix(url_https)
+                    if resp.status_code not in (200, 206):
+                        resp.close()
                         return None
                     url = url_https
                 else:
                     return None
 
-            text = resp.text.lower()
-            for indicator in PARKED_INDICATORS:
-                if indicator in text:
-                    return None
+            # Body is decoded once and scanned case-insensitively, only until a parked hit
+            _, parked = _read_page(resp, limit=PARKED_SCAN_BYTES)
+            if parked:
+                return None
 
             # Use the final URL after redirects (normalize to base)
             final = urlparse(resp.url)
@@ -933,6 +1396,17 @@ class ConferenceDiscoverer:
 # ReportGenerator
 # ---------------------------------------------------------------------------
 
+# Console summary annotation per classification
+_SUMMARY_TAGS = {
+    'PARKED_DOMAIN': ' [FIXABLE]',
+    'REDIRECT_DOMAIN': ' [FIXABLE]',
+    'DNS_DEAD': ' [skip]',
+    'NO_BASEBALL': ' [skip]',
+    'WRONG_URLS': ' [maybe]',
+    'ZERO_PLAYERS': ' [maybe]',
+}
+
+
 class ReportGenerator:
     def __init__(self):
         self.reports_dir = Path(__file__).parent / 'reports'
@@ -940,10 +1414,7 @@ class ReportGenerator:
 
     def print_summary(self, classifications: dict):
         """Print a summary table to the console."""
-        counts = {}
-        for info in classifications.values():
-            cat = info['classification'].value
-            counts[cat] = counts.get(cat, 0) + 1
+        counts = Counter(info['classification'].value for info in classifications.values())
 
         print("\n" + "=" * 60)
         print("CLASSIFICATION SUMMARY")
@@ -952,15 +1423,8 @@ class ReportGenerator:
         print("-" * 35)
 
         # Sort by count descending
-        for cat, count in sorted(counts.items(), key=lambda x: -x[1]):
-            fixable = ""
-            if cat in ('PARKED_DOMAIN', 'REDIRECT_DOMAIN'):
-                fixable = " [FIXABLE]"
-            elif cat in ('DNS_DEAD', 'NO_BASEBALL'):
-                fixable = " [skip]"
-            elif cat in ('WRONG_URLS', 'ZERO_PLAYERS'):
-                fixable = " [maybe]"
-            print(f"  {cat:<23} {count:>6}{fixable}")
+        for cat, count in counts.most_common():
+            print(f"  {cat:<23} {count:>6}{_SUMMARY_TAGS.get(cat, '')}")
 
         total = sum(counts.values())
         print("-" * 35)
@@ -972,27 +1436,24 @@ class ReportGenerator:
         if path is None:
             path = str(self.reports_dir / 'classification_report.csv')
 
-        rows = []
-        for name, info in sorted(classifications.items()):
-            rows.append({
-                'school_name': name,
-                'division': info['school']['division'],
-                'conference': info['school']['conference'],
-                'classification': info['classification'].value,
-                'details': info['details'],
-                'base_url': info['base_url'],
-                'new_url': info.get('new_url', ''),
-            })
-
         with open(path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=[
                 'school_name', 'division', 'conference', 'classification',
                 'details', 'base_url', 'new_url'
             ])
             writer.writeheader()
-            writer.writerows(rows)
+            for name, info in sorted(classifications.items()):
+                writer.writerow({
+                    'school_name': name,
+                    'division': info['school']['division'],
+                    'conference': info['school']['conference'],
+                    'classification': info['classification'].value,
+                    'details': info['details'],
+                    'base_url': info['base_url'],
+                    'new_url': info.get('new_url', ''),
+                })
 
-        logger.info(f"Classification report saved to {path} ({len(rows)} schools)")
+        logger.info(f"Classification report saved to {path} ({len(classifications)} schools)")
 
     def save_fixes_csv(self, fixes: list, path: str = None):
         """Save domain fixes to CSV."""
@@ -1012,23 +1473,21 @@ class ReportGenerator:
         """Apply domain fixes to schools_database.csv."""
         fix_map = {f['school_name']: f['new_url'] for f in fixes}
 
-        # Read existing CSV
-        rows = []
-        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
+        # Stream rows into a sibling file, then swap it in — the original
+        # is never half-written if the run dies partway
+        tmp_path = f"{csv_path}.tmp"
+        with open(csv_path, 'r', newline='', encoding='utf-8') as src, \
+                open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.DictReader(src)
+            writer = csv.DictWriter(dst, fieldnames=reader.fieldnames)
+            writer.writeheader()
             for row in reader:
                 if row['school_name'] in fix_map:
                     old = row['athletics_base_url']
                     row['athletics_base_url'] = fix_map[row['school_name']]
                     logger.info(f"  Updated {row['school_name']}: {old} -> {row['athletics_base_url']}")
-                rows.append(row)
-
-        # Write back
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+                writer.writerow(row)
+        os.replace(tmp_path, csv_path)
 
         logger.info(f"Updated {len(fix_map)} schools in {csv_path}")
 
@@ -1037,18 +1496,36 @@ class ReportGenerator:
 # Rescrape helper
 # ---------------------------------------------------------------------------
 
+# Fixed schools rescraped at once
+RESCRAPE_WORKERS = 8
+
+
 def rescrape_fixed_schools(fixes: list, csv_path: str):
     """Re-run the scraper on schools that got new domains."""
     from main import CollegeBaseballScraper
+    from url_discovery import UrlDiscoverer
 
     scraper = CollegeBaseballScraper()
 
-    # Reload CSV to get updated rows
-    schools = []
-    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            schools.append(row)
+    # scrape_school reads per-school error state off its request handler and
+    # caches links on its url discoverer — each worker gets its own of both
+    local = threading.local()
+    worker_handlers = []
+    handlers_lock = threading.Lock()
+
+    def scrape_in_worker(school: dict) -> dict:
+        worker = getattr(local, 'scraper', None)
+        if worker is None:
+            worker = copy.copy(scraper)
+            worker.request_handler = ProtectedRequestHandler(scraper.config, ERROR_CONFIG)
+            worker.url_discoverer = UrlDiscoverer()
+            with handlers_lock:
+                worker_handlers.append(worker.request_handler)
+            local.scraper = worker
+        return worker.scrape_school(school)
+
+    # Reload CSV to get updated rows (a changed file is parsed afresh)
+    schools = load_schools_csv(csv_path)
 
     fixed_names = {f['school_name'] for f in fixes}
     fixed_schools = [s for s in schools if s['school_name'] in fixed_names]
@@ -1056,21 +1533,30 @@ def rescrape_fixed_schools(fixes: list, csv_path: str):
     logger.info(f"Rescraping {len(fixed_schools)} schools with fixed domains...")
     success_count = 0
 
-    for i, school in enumerate(fixed_schools):
-        name = school['school_name']
-        logger.info(f"  [{i+1}/{len(fixed_schools)}] Scraping {name} ({school['athletics_base_url']})")
+    # Fetch and parse on the pool; saves stay on this thread since the
+    # DB manager holds one connection
+    with ThreadPoolExecutor(max_workers=RESCRAPE_WORKERS) as executor:
+        futures = {executor.submit(scrape_in_worker, school): school
+                   for school in fixed_schools}
+        for i, future in enumerate(as_completed(futures)):
+            school = futures[future]
+            name = school['school_name']
+            logger.info(f"  [{i+1}/{len(fixed_schools)}] Scraped {name} ({school['athletics_base_url']})")
 
-        try:
-            result = scraper.scrape_school(school)
-            if result.get('success') and result.get('players'):
-                player_count = scraper.db.save_school_data(result)
-                logger.info(f"    -> Saved {player_count} players")
-                success_count += 1
-            else:
-                errors = result.get('errors', [])
-                logger.info(f"    -> Failed: {errors[:2] if errors else 'no players found'}")
-        except Exception as e:
-            logger.error(f"    -> Error: {e}")
+            try:
+                result = future.result()
+                if result.get('success') and result.get('players'):
+                    player_count = scraper.db.save_school_data(result)
+                    logger.info(f"    -> Saved {player_count} players")
+                    success_count += 1
+                else:
+                    errors = result.get('errors', [])
+                    logger.info(f"    -> Failed: {errors[:2] if errors else 'no players found'}")
+            except Exception as e:
+                logger.error(f"    -> Error: {e}")
+
+    for handler in worker_handlers:
+        handler.close()
 
     logger.info(f"\nRescrape complete: {success_count}/{len(fixed_schools)} schools succeeded")
 
@@ -1079,7 +1565,21 @@ def rescrape_fixed_schools(fixes: list, csv_path: str):
 # CLI
 # ---------------------------------------------------------------------------
 
-def load_cached_classifications(reports_dir: Path) -> dict | None:
+def load_schools_csv(path: str) -> list:
+    """Rows of a schools CSV as dicts, parsed once per version of the file.
+    Phases in one run share the rows, so callers must not mutate them."""
+    st = os.stat(path)
+    return _load_schools_csv(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_schools_csv(path: str, mtime_ns: int, size: int) -> list:
+    # mtime/size are only cache keys — a rewritten CSV misses and reloads
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def load_cached_classifications(reports_dir: Path, csv_path: str = None) -> dict | None:
     """Load classifications from the cached CSV report."""
     path = reports_dir / 'classification_report.csv'
     if not path.exists():
@@ -1087,11 +1587,9 @@ def load_cached_classifications(reports_dir: Path) -> dict | None:
 
     results = {}
     # Also need to reload school data from CSV for the school dict
-    csv_path = str(Path(__file__).parent / 'schools_database.csv')
-    school_map = {}
-    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-        for row in csv.DictReader(f):
-            school_map[row['school_name']] = row
+    if csv_path is None:
+        csv_path = str(Path(__file__).parent / 'schools_database.csv')
+    school_map = {row['school_name']: row for row in load_schools_csv(csv_path)}
 
     with open(path, 'r', newline='', encoding='utf-8') as f:
         for row in csv.DictReader(f):
@@ -1173,12 +1671,13 @@ def main():
         classifications = validator.classify_all(failed)
         report.print_summary(classifications)
         report.save_classification_csv(classifications)
+        validator.session.close()
         validator.db.close()
 
     # Phase 2: Fix domains (domain variations + DuckDuckGo)
     if run_fix:
         if classifications is None:
-            classifications = load_cached_classifications(reports_dir)
+            classifications = load_cached_classifications(reports_dir, csv_path)
             if classifications is None:
                 print("ERROR: No classification data. Run --classify first.")
                 sys.exit(1)
@@ -1199,20 +1698,20 @@ def main():
     # Phase 2b: Discover from conference websites
     if run_conferences:
         if classifications is None:
-            classifications = load_cached_classifications(reports_dir)
+            classifications = load_cached_classifications(reports_dir, csv_path)
             if classifications is None:
                 print("ERROR: No classification data. Run --classify first.")
                 sys.exit(1)
 
-        # Load CSV schools for name matching
-        csv_schools = []
-        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                csv_schools.append(row)
+        # CSV schools for name matching (shared with the earlier phases' load)
+        csv_schools = load_schools_csv(csv_path)
 
         print("\n>>> Phase 2b: Scraping conference websites for correct URLs...")
         discoverer = ConferenceDiscoverer()
-        conf_fixes = discoverer.discover_all(classifications, csv_schools)
+        try:
+            conf_fixes = discoverer.discover_all(classifications, csv_schools)
+        finally:
+            discoverer.close()
 
         if conf_fixes:
             print(f"\nFound {len(conf_fixes)} schools via conference sites:")